@@ -1,5 +1,7 @@
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import List, Optional
 
 from .task import Task
@@ -63,7 +65,8 @@ class ConflictDetector:
 
         # Calculate the total duration including buffer
         total_duration = task.duration + (2 * required_buffer)  # Buffer before and after
-        buffer_start = proposed_start - timedelta(minutes=required_buffer)
+        buffer_delta = timedelta(minutes=required_buffer)
+        buffer_start = proposed_start - buffer_delta
         
         # Get all events that could affect buffer requirements
         all_conflicts = time_block.get_conflicts(buffer_start, total_duration)
@@ -87,10 +90,10 @@ class ConflictDetector:
             if (
                 # Check if event ends too close to our start
                 (event.end <= proposed_start and 
-                 (proposed_start - event.end).total_seconds() / 60 < required_buffer) or
+                 proposed_start - event.end < buffer_delta) or
                 # Check if event starts too close to our end
                 (event.start >= proposed_end and 
-                 (event.start - proposed_end).total_seconds() / 60 < required_buffer)
+                 event.start - proposed_end < buffer_delta)
             )
         ]
         if buffer_conflicts:
@@ -108,7 +111,7 @@ class ConflictDetector:
                     task=task,
                     conflicting_events=[],
                     proposed_start=proposed_start,
-                    message=f"Task requires {task.constraints.zone_type.value} zone"
+                    message=f"Task requires {task.constraints.zone_type.name.lower()} zone"
                 )
                 
             if time_block.energy_level != task.constraints.energy_level:
@@ -116,7 +119,7 @@ class ConflictDetector:
                     task=task,
                     conflicting_events=[],
                     proposed_start=proposed_start,
-                    message=f"Task requires {task.constraints.energy_level.value} energy level"
+                    message=f"Task requires {task.constraints.energy_level.name.lower()} energy level"
                 )
                 
             if task.duration < time_block.min_duration:
@@ -151,17 +154,28 @@ class ConflictDetector:
             # adjust start time to include buffer after previous event if needed
             last_event_before = max(
                 (e for e in all_events if e.end <= current_time),
-                key=lambda e: e.end,
+                key=attrgetter('end'),
                 default=None
             )
             if last_event_before:
                 min_start = last_event_before.end + timedelta(minutes=required_buffer)
                 current_time = max(current_time, min_start)
         
+        step = timedelta(minutes=15)  # 15-minute increments
+        buffer_delta = timedelta(minutes=required_buffer)
         while current_time < end_time:
-            if not ConflictDetector.find_conflicts(task, current_time, time_block):
+            conflict = ConflictDetector.find_conflicts(task, current_time, time_block)
+            if not conflict:
                 return current_time
-            current_time += timedelta(minutes=15)  # 15-minute increments
+            if not conflict.conflicting_events:
+                # Zone mismatches do not depend on the start time
+                return None
+
+            # Every increment before the conflicting events end (plus buffer)
+            # overlaps them too, so sweep past them in one jump
+            clear_at = max(e.end for e in conflict.conflicting_events) + buffer_delta
+            steps = max(1, -(-(clear_at - current_time) // step))
+            current_time += steps * step
             
         return None
 
@@ -181,14 +195,21 @@ class ConflictDetector:
         """
         end_time = start_time + timedelta(minutes=task.duration)
         
-        # Sort zones by start time
-        sorted_zones = sorted(zones, key=lambda z: z.start)
+        # Sort zones by start time and index their starts for bisection
+        sorted_zones = sorted(zones, key=attrgetter('start'))
+        zone_starts = [z.start for z in sorted_zones]
         
+        # Time blocks cannot overlap, so only zones sharing the latest start at
+        # or before start_time can contain it; like a front-to-back scan, the
+        # first of those (in input order) that contains start_time is used
+        last = bisect_right(zone_starts, start_time)
+        first = bisect_left(zone_starts, zone_starts[last - 1]) if last else 0
+        current_index = next(
+            (i for i in range(first, last) if start_time < sorted_zones[i].end), None
+        )
         current_zone = None
-        for zone in sorted_zones:
-            if zone.start <= start_time < zone.end:
-                current_zone = zone
-                break
+        if current_index is not None:
+            current_zone = sorted_zones[current_index]
                 
         if not current_zone:
             return ZoneTransitionConflict(
@@ -200,7 +221,7 @@ class ConflictDetector:
         # Check if task extends beyond current zone
         if end_time > current_zone.end:
             # Find next zone
-            next_zone_index = sorted_zones.index(current_zone) + 1
+            next_zone_index = current_index + 1
             if next_zone_index >= len(sorted_zones):
                 return ZoneTransitionConflict(
                     "Task extends beyond available zones",
@@ -214,8 +235,8 @@ class ConflictDetector:
             if (current_zone.zone_type != next_zone.zone_type or 
                 current_zone.energy_level != next_zone.energy_level):
                 return ZoneTransitionConflict(
-                    f"Incompatible zone transition: {current_zone.zone_type}/{current_zone.energy_level} -> "
-                    f"{next_zone.zone_type}/{next_zone.energy_level}",
+                    f"Incompatible zone transition: {current_zone.zone_type.name}/{current_zone.energy_level.name} -> "
+                    f"{next_zone.zone_type.name}/{next_zone.energy_level.name}",
                     current_zone,
                     next_zone
                 )
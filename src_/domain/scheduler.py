@@ -1,8 +1,10 @@
-from typing import List, Protocol
+from collections import OrderedDict
+from copy import copy
+from typing import Callable, List, Optional, Protocol
 from datetime import datetime, timedelta
 
 from .task import Task
-from .timeblock import Event, TimeBlockZone, ZoneType, EnergyLevel
+from .timeblock import Event, TimeBlockZone, TimeBlockType, ZoneType, EnergyLevel
 from .scheduling import SchedulingStrategy
 
 """
@@ -50,14 +52,37 @@ class CalendarRepository(Protocol):
     def remove_managed_events(self) -> None:
         pass
 
+def _task_signature(task: Task) -> tuple:
+    """Hashable snapshot of every task field that can affect its placement"""
+    c = task.constraints
+    return (task.id, task.title, task.duration, task.due_date, task.project_id,
+            task.sequence_number, c.zone_type, c.energy_level, c.is_splittable,
+            c.min_chunk_duration, c.max_split_count, c.required_buffer,
+            tuple(c.dependencies))
+
+def _event_signature(event: Event) -> tuple:
+    return (event.id, event.start, event.end, event.type, event.buffer_required)
+
+# Distinct reschedule() inputs remembered per Scheduler
+_RESCHEDULE_CACHE_SIZE = 16
+
 class Scheduler:
     def __init__(self,
                  task_repo: TaskRepository,
                  calendar_repo: CalendarRepository,
-                 strategy: SchedulingStrategy):
+                 strategy: SchedulingStrategy,
+                 clock: Optional[Callable[[], datetime]] = None):
         self.task_repo = task_repo
         self.calendar_repo = calendar_repo
         self.strategy = strategy
+        self.clock = clock
+        # Recent reschedule() results keyed by strategy, window start, tasks and
+        # fixed events, least recently used first
+        self._cache: 'OrderedDict[tuple, List[Event]]' = OrderedDict()
+
+    def _now(self) -> datetime:
+        """Current time from the injected clock, falling back to the system clock"""
+        return self.clock() if self.clock else datetime.now()
     
     def schedule_tasks(self, planning_horizon: int = 7) -> List[Event]:
         """Schedule tasks within the given planning horizon"""
@@ -67,7 +92,7 @@ class Scheduler:
             return []
 
         # Calculate planning window
-        start = datetime.now().replace(hour=9, minute=0)
+        start = self._now().replace(hour=9, minute=0)
         end = start + timedelta(days=planning_horizon)
         
         # Get existing events
@@ -80,8 +105,7 @@ class Scheduler:
             zone_type=ZoneType.DEEP,
             energy_level=EnergyLevel.HIGH,
             min_duration=30,
-            buffer_required=15,
-            events=[]
+            buffer_required=15
         )]
         
         # Use strategy to create schedule
@@ -111,8 +135,9 @@ class Scheduler:
         # Remove existing managed events
         self.calendar_repo.remove_managed_events()
         
-        # Calculate planning window
-        start = datetime.now().replace(hour=9, minute=0)
+        # Calculate planning window; it starts on the minute so the same
+        # day's calls share a cache key
+        start = self._now().replace(hour=9, minute=0, second=0, microsecond=0)
         end = start + timedelta(days=7)  # Default 7-day planning horizon
         
         # Get existing fixed events if not provided
@@ -120,6 +145,16 @@ class Scheduler:
             fixed_events = [e for e in self.calendar_repo.get_events(start, end)
                           if e.type == TimeBlockType.FIXED]
         
+        # Identical inputs produce an identical schedule
+        key = (self.strategy, start,
+               tuple(_task_signature(t) for t in tasks),
+               tuple(_event_signature(e) for e in fixed_events))
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            # Copies, so callers cannot alter the cached schedule
+            return [copy(e) for e in cached]
+
         # Create default zone if none provided
         zones = [TimeBlockZone(
             start=start,
@@ -132,4 +167,8 @@ class Scheduler:
         )]
         
         # Schedule tasks using strategy
-        return self.strategy.schedule(tasks, zones, fixed_events)
+        scheduled_events = self.strategy.schedule(tasks, zones, fixed_events)
+        self._cache[key] = [copy(e) for e in scheduled_events]
+        if len(self._cache) > _RESCHEDULE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return scheduled_events
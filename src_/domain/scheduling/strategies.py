@@ -1,157 +1,157 @@
-from typing import List, Tuple
+import logging
+from bisect import bisect_left
+from collections import defaultdict
+from heapq import heapify, heappop, heappush
+from typing import Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
+from operator import attrgetter
 from ..task import Task
 from ..timeblock import TimeBlockZone, Event, TimeBlockType
 from ..conflict import ConflictDetector
 from .base import SchedulingStrategy
 
+logger = logging.getLogger(__name__)
+
+MINUTES_PER_DAY = 24 * 60
+
 class SequenceBasedStrategy(SchedulingStrategy):
     def schedule(self, tasks: List[Task], zones: List[TimeBlockZone], existing_events: List[Event]) -> List[Event]:
         if not zones:
             return []
             
-        print("\nStarting scheduling process:")
-        print(f"Total tasks to schedule: {len(tasks)}")
-        print(f"Available zones: {len(zones)}")
-        print(f"Existing events: {len(existing_events)}")
+        logger.debug("Starting scheduling process:")
+        logger.debug("Total tasks to schedule: %s", len(tasks))
+        logger.debug("Available zones: %s", len(zones))
+        logger.debug("Existing events: %s", len(existing_events))
             
-        events = existing_events.copy()  # Include existing events
+        events = list(existing_events)  # Include existing events, which may be a tuple
         scheduled_task_ids = set()
-        remaining_tasks = tasks.copy()
+
+        # Kahn's algorithm: count each task's unmet dependencies and release
+        # its dependents into the ready heap once it is scheduled
+        dependents = defaultdict(list)
+        unmet = []
+        for index, task in enumerate(tasks):
+            deps = task.constraints.dependencies
+            if deps:
+                deps = set(deps)  # Repeated IDs must not inflate the count
+            unmet.append(len(deps))
+            for dep in deps:
+                dependents[dep].append(index)
+
+        def priority(index: int) -> tuple:
+            # Among equally urgent ready tasks, prefer those that unblock the
+            # most others; input order breaks any remaining tie
+            t = tasks[index]
+            return (t.due_date, -len(dependents.get(t.id, ())), t.project_id,
+                    t.sequence_number, index)
+
+        ready = [priority(i) for i, count in enumerate(unmet) if count == 0]
+        heapify(ready)
+        pending = set(range(len(tasks)))
         
         # Create multi-day zones based on planning horizon
         all_zones = self._create_multi_day_zones(zones, days=7)
-        print(f"\nCreated {len(all_zones)} multi-day zones")
+        logger.debug("Created %s multi-day zones", len(all_zones))
+
+        # Zones come out day by day; when their ends are also in order, single
+        # block placement can bisect past the zones that end too early
+        zone_ends = [z.end for z in all_zones]
+        if any(a > b for a, b in zip(zone_ends, zone_ends[1:])):
+            zone_ends = None
         
-        while remaining_tasks:
-            available_tasks = [
-                task for task in remaining_tasks
-                if all(dep in scheduled_task_ids for dep in task.constraints.dependencies)
-            ]
+        while pending:
+            logger.debug("Remaining tasks: %s", len(pending))
+            logger.debug("Available tasks: %s", len(ready))
+            logger.debug("Scheduled task IDs: %s", scheduled_task_ids)
             
-            print(f"\nRemaining tasks: {len(remaining_tasks)}")
-            print(f"Available tasks: {len(available_tasks)}")
-            print(f"Scheduled task IDs: {scheduled_task_ids}")
-            
-            if not available_tasks:
-                if remaining_tasks:
-                    print(f"DEBUG: Dependency deadlock detected")
-                    print(f"Remaining tasks: {[t.id for t in remaining_tasks]}")
-                    print(f"Their dependencies: {[t.constraints.dependencies for t in remaining_tasks]}")
+            if not ready:
+                remaining_tasks = [tasks[i] for i in sorted(pending)]
+                logger.debug("Dependency deadlock detected")
+                logger.debug("Remaining tasks: %s", [t.id for t in remaining_tasks])
+                logger.debug("Their dependencies: %s",
+                             [t.constraints.dependencies for t in remaining_tasks])
                 break
                 
-            available_tasks.sort(key=lambda t: (t.due_date, t.project_id, t.sequence_number))
-            task = available_tasks[0]
+            index = heappop(ready)[-1]
+            task = tasks[index]
             
-            print(f"\nAttempting to schedule task: {task.id}")
-            print(f"Task zone type: {task.constraints.zone_type}")
-            print(f"Task duration: {task.duration}")
-            print(f"Dependencies: {task.constraints.dependencies}")
+            logger.debug("Attempting to schedule task: %s", task.id)
+            logger.debug("Task zone type: %s", task.constraints.zone_type)
+            logger.debug("Task duration: %s", task.duration)
+            logger.debug("Dependencies: %s", task.constraints.dependencies)
             
             # Always try splitting for splittable tasks
             if task.constraints.is_splittable:
-                print(f"Attempting to split task {task.id}")
+                logger.debug("Attempting to split task %s", task.id)
                 scheduled = self._try_schedule_split_task(task, all_zones, events, scheduled_task_ids)
             else:
-                print(f"Attempting to schedule task {task.id} as single block")
-                scheduled = self._try_schedule_task(task, all_zones, events, scheduled_task_ids)
+                logger.debug("Attempting to schedule task %s as single block", task.id)
+                scheduled = self._try_schedule_task(task, all_zones, events, scheduled_task_ids,
+                                                    zone_ends)
             
             if scheduled:
-                print(f"Successfully scheduled task {task.id}")
-                remaining_tasks.remove(task)
+                logger.debug("Successfully scheduled task %s", task.id)
+                pending.discard(index)
+                for dependent in dependents.pop(task.id, ()):
+                    unmet[dependent] -= 1
+                    if unmet[dependent] == 0:
+                        heappush(ready, priority(dependent))
             else:
-                print(f"\nFailed to schedule task {task.id}")
-                print("Available zones:")
-                for zone in all_zones:
-                    print(f"- Zone: {zone.zone_type}, Time: {zone.start}-{zone.end}")
-                print("Current events:")
-                for event in events:
-                    print(f"- Event: {event.id}, Time: {event.start}-{event.end}")
+                logger.debug("Failed to schedule task %s", task.id)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Available zones:")
+                    for zone in all_zones:
+                        logger.debug("- Zone: %s, Time: %s-%s", zone.zone_type, zone.start, zone.end)
+                    logger.debug("Current events:")
+                    for event in events:
+                        logger.debug("- Event: %s, Time: %s-%s", event.id, event.start, event.end)
                 break
                 
         return [e for e in events if e.type == TimeBlockType.MANAGED]
 
+    def _gaps(self, zone: TimeBlockZone, events: List[Event],
+              buffer: Optional[int] = None) -> Iterator[Tuple[datetime, datetime]]:
+        """
+        Yield the gaps between events overlapping the zone in one pass.
+
+        Each gap after an event starts once that event's buffer has passed;
+        buffer overrides the per-event buffer_required when given.
+        """
+        zone_events = sorted(
+            (e for e in events if e.end > zone.start and e.start < zone.end),
+            key=attrgetter('start')
+        )
+
+        # A fixed buffer override needs only one timedelta for the whole sweep
+        buffer_delta = None if buffer is None else timedelta(minutes=buffer)
+
+        cursor = zone.start
+        for event in zone_events:
+            yield cursor, event.start
+            if buffer_delta is None:
+                cursor = event.end + timedelta(minutes=event.buffer_required)
+            else:
+                cursor = event.end + buffer_delta
+        yield cursor, zone.end
+
     def _find_available_slots(self, zone: TimeBlockZone, events: List[Event], 
                             min_duration: int) -> List[Tuple[datetime, datetime]]:
         """Find available time slots in a zone, respecting buffer requirements"""
-        slots = []
-        current = zone.start
-        
-        # Get events that overlap with this zone, including fixed events
-        zone_events = [
-            e for e in events 
-            if e.end > zone.start and e.start < zone.end
+        min_delta = timedelta(minutes=min_duration)
+        return [
+            (start, end) for start, end in self._gaps(zone, events)
+            if end - start >= min_delta
         ]
-        zone_events.sort(key=lambda e: e.start)
-        
-        if not zone_events:
-            if (zone.end - zone.start).total_seconds() / 60 >= min_duration:
-                slots.append((zone.start, zone.end))
-            return slots
-        
-        # Check slot before first event
-        if (zone_events[0].start - current).total_seconds() / 60 >= min_duration:
-            slots.append((current, zone_events[0].start))
-        
-        # Check slots between events
-        for i in range(len(zone_events) - 1):
-            current_event = zone_events[i]
-            next_event = zone_events[i + 1]
-            
-            slot_start = current_event.end + timedelta(minutes=current_event.buffer_required)
-            if (next_event.start - slot_start).total_seconds() / 60 >= min_duration:
-                slots.append((slot_start, next_event.start))
-        
-        # Check final slot
-        last_event = zone_events[-1]
-        final_start = last_event.end + timedelta(minutes=last_event.buffer_required)
-        if (zone.end - final_start).total_seconds() / 60 >= min_duration:
-            slots.append((final_start, zone.end))
-        
-        return slots
 
     def _find_available_slots_with_duration(self, zone: TimeBlockZone, events: List[Event], 
                                           min_duration: int, required_buffer: int) -> List[Tuple[datetime, datetime]]:
         """Find available time slots in a zone that can fit the specified duration"""
-        slots = []
-        current = zone.start
-        
-        # Get events that overlap with this zone
-        zone_events = [e for e in events if e.end > zone.start and e.start < zone.end]
-        zone_events.sort(key=lambda e: e.start)
-        
-        if not zone_events:
-            duration_minutes = (zone.end - zone.start).total_seconds() / 60
-            if duration_minutes >= min_duration:
-                slots.append((zone.start, zone.end))
-            return slots
-        
-        # Check slot before first event
-        first_slot_duration = (zone_events[0].start - current).total_seconds() / 60
-        if first_slot_duration >= min_duration:
-            slots.append((current, zone_events[0].start))
-        
-        # Check slots between events
-        for i in range(len(zone_events) - 1):
-            current_event = zone_events[i]
-            next_event = zone_events[i + 1]
-            
-            # Add required buffer after current event
-            slot_start = current_event.end + timedelta(minutes=required_buffer)
-            slot_duration = (next_event.start - slot_start).total_seconds() / 60
-            
-            if slot_duration >= min_duration:
-                slots.append((slot_start, next_event.start))
-        
-        # Check final slot
-        last_event = zone_events[-1]
-        final_start = last_event.end + timedelta(minutes=required_buffer)
-        final_duration = (zone.end - final_start).total_seconds() / 60
-        
-        if final_duration >= min_duration:
-            slots.append((final_start, zone.end))
-        
-        return slots
+        min_delta = timedelta(minutes=min_duration)
+        return [
+            (start, end) for start, end in self._gaps(zone, events, required_buffer)
+            if end - start >= min_delta
+        ]
 
     def _try_schedule_split_task(self, task: Task, zones: List[TimeBlockZone], 
                                 events: List[Event], scheduled_task_ids: set) -> bool:
@@ -161,14 +161,14 @@ class SequenceBasedStrategy(SchedulingStrategy):
         task_events = []
         current_events = events.copy()
         
-        print(f"\n=== Starting split scheduling for task: {task.id} ===")
-        print(f"Total duration: {task.duration} minutes")
-        print(f"Min chunk duration: {task.constraints.min_chunk_duration} minutes")
-        print(f"Max split count: {task.constraints.max_split_count}")
-        print(f"Buffer required: {task.constraints.required_buffer} minutes")
+        logger.debug("=== Starting split scheduling for task: %s ===", task.id)
+        logger.debug("Total duration: %s minutes", task.duration)
+        logger.debug("Min chunk duration: %s minutes", task.constraints.min_chunk_duration)
+        logger.debug("Max split count: %s", task.constraints.max_split_count)
+        logger.debug("Buffer required: %s minutes", task.constraints.required_buffer)
         
         # Sort zones chronologically
-        sorted_zones = sorted(zones, key=lambda z: z.start)
+        sorted_zones = sorted(zones, key=attrgetter('start'))
         
         # Calculate optimal chunk size
         optimal_chunk_size = max(
@@ -176,14 +176,14 @@ class SequenceBasedStrategy(SchedulingStrategy):
             task.constraints.min_chunk_duration  # But respect minimum chunk duration
         )
         
-        print(f"Calculated optimal chunk size: {optimal_chunk_size} minutes")
+        logger.debug("Calculated optimal chunk size: %s minutes", optimal_chunk_size)
         
         while remaining_duration > 0 and chunk_count < task.constraints.max_split_count:
             chunk_duration = min(remaining_duration, optimal_chunk_size)
             
-            print(f"\nAttempting to schedule chunk {chunk_count + 1}")
-            print(f"Chunk duration: {chunk_duration} minutes")
-            print(f"Remaining duration: {remaining_duration} minutes")
+            logger.debug("Attempting to schedule chunk %s", chunk_count + 1)
+            logger.debug("Chunk duration: %s minutes", chunk_duration)
+            logger.debug("Remaining duration: %s minutes", remaining_duration)
             
             chunk_scheduled = False
             for zone in sorted_zones:
@@ -206,7 +206,8 @@ class SequenceBasedStrategy(SchedulingStrategy):
                         buffer_required=task.constraints.required_buffer
                     )
                     
-                    print(f"Scheduled chunk {chunk_count + 1}: {event.start} - {event.end}")
+                    logger.debug("Scheduled chunk %s: %s - %s",
+                                 chunk_count + 1, event.start, event.end)
                     
                     current_events.append(event)
                     task_events.append(event)
@@ -216,15 +217,16 @@ class SequenceBasedStrategy(SchedulingStrategy):
                     break
                 
             if not chunk_scheduled:
-                print(f"Failed to schedule chunk {chunk_count + 1}")
+                logger.debug("Failed to schedule chunk %s", chunk_count + 1)
                 return False
         
-        print(f"\nFinal scheduling result:")
-        print(f"Total chunks created: {len(task_events)}")
-        print(f"Remaining duration: {remaining_duration}")
-        for idx, event in enumerate(task_events, 1):
-            print(f"Chunk {idx}: {event.start} - {event.end} "
-                  f"({(event.end - event.start).total_seconds() / 60} minutes)")
+        logger.debug("Final scheduling result:")
+        logger.debug("Total chunks created: %s", len(task_events))
+        logger.debug("Remaining duration: %s", remaining_duration)
+        if logger.isEnabledFor(logging.DEBUG):
+            for idx, event in enumerate(task_events, 1):
+                logger.debug("Chunk %s: %s - %s (%s minutes)",
+                             idx, event.start, event.end, event.duration_minutes)
         
         if remaining_duration <= 0:
             events.extend(task_events)
@@ -270,42 +272,63 @@ class SequenceBasedStrategy(SchedulingStrategy):
         return False
 
     def _try_schedule_task(self, task: Task, zones: List[TimeBlockZone], 
-                          events: List[Event], scheduled_task_ids: set) -> bool:
-        """Try to schedule task as a single block"""
-        print(f"\nTrying to schedule task {task.id} in available zones")
-        
-        for zone in zones:
+                          events: List[Event], scheduled_task_ids: set,
+                          zone_ends: Optional[List[datetime]] = None) -> bool:
+        """
+        Try to schedule task as a single block.
+
+        zone_ends, when given, holds the zones' end times in non-decreasing
+        order and lets the search start at the first zone that can still fit
+        the task.
+        """
+        logger.debug("Trying to schedule task %s in available zones", task.id)
+
+        duration = timedelta(minutes=task.duration)
+
+        # Earliest start allowed by the previous event and its buffer; the
+        # same for every zone, so zones ending before it can fit the task
+        # are pruned without further checks
+        earliest_start = None
+        if events:
+            last_event = events[-1]
+            required_buffer = max(
+                task.constraints.required_buffer,
+                last_event.buffer_required
+            )
+            earliest_start = last_event.end + timedelta(minutes=required_buffer)
+            logger.debug("Last event ends at %s, using buffer %s", last_event.end, required_buffer)
+
+        first = 0
+        if earliest_start is not None and zone_ends is not None:
+            first = bisect_left(zone_ends, earliest_start + duration)
+
+        for i in range(first, len(zones)):
+            zone = zones[i]
             if zone.zone_type != task.constraints.zone_type:
-                print(f"Skipping zone - type mismatch: {zone.zone_type} != {task.constraints.zone_type}")
+                logger.debug("Skipping zone - type mismatch: %s != %s",
+                             zone.zone_type, task.constraints.zone_type)
                 continue
-                
-            print(f"Checking zone: {zone.zone_type} ({zone.start} - {zone.end})")
-            
-            # Calculate required buffer based on previous event
-            if events:
-                last_event = events[-1]
-                required_buffer = max(
-                    task.constraints.required_buffer,
-                    last_event.buffer_required
-                )
-                current_time = max(
-                    zone.start,
-                    last_event.end + timedelta(minutes=required_buffer)
-                )
-                print(f"Last event ends at {last_event.end}, using buffer {required_buffer}")
-                print(f"Calculated start time: {current_time}")
+
+            if earliest_start is not None and earliest_start + duration > zone.end:
+                continue
+
+            logger.debug("Checking zone: %s (%s - %s)", zone.zone_type, zone.start, zone.end)
+
+            if earliest_start is not None:
+                current_time = max(zone.start, earliest_start)
+                logger.debug("Calculated start time: %s", current_time)
             else:
                 current_time = zone.start
-                print(f"No previous events, starting at zone start: {current_time}")
+                logger.debug("No previous events, starting at zone start: %s", current_time)
         
-            if current_time + timedelta(minutes=task.duration) <= zone.end:
+            if current_time + duration <= zone.end:
                 conflict = ConflictDetector.find_conflicts(task, current_time, zone)
                 if not conflict:
-                    print(f"Found valid slot at {current_time}")
+                    logger.debug("Found valid slot at %s", current_time)
                     event = Event(
                         id=task.id,
                         start=current_time,
-                        end=current_time + timedelta(minutes=task.duration),
+                        end=current_time + duration,
                         title=task.title,
                         type=TimeBlockType.MANAGED,
                         buffer_required=task.constraints.required_buffer
@@ -314,11 +337,11 @@ class SequenceBasedStrategy(SchedulingStrategy):
                     scheduled_task_ids.add(task.id)
                     return True
                 else:
-                    print(f"Conflict detected: {conflict.message}")
+                    logger.debug("Conflict detected: %s", conflict.message)
             else:
-                print(f"Not enough time in zone: need {task.duration} minutes")
+                logger.debug("Not enough time in zone: need %s minutes", task.duration)
                 
-        print(f"No suitable zone found for task {task.id}")
+        logger.debug("No suitable zone found for task %s", task.id)
         return False
 
     def _create_multi_day_zones(self, base_zones: List[TimeBlockZone], days: int = 7) -> List[TimeBlockZone]:
@@ -326,18 +349,27 @@ class SequenceBasedStrategy(SchedulingStrategy):
         multi_day_zones = []
         start_date = base_zones[0].start
 
+        # Work in integer minutes from midnight of the first day instead of
+        # calling datetime.replace() for every zone of every day
+        origin = start_date - timedelta(hours=start_date.hour, minutes=start_date.minute)
+        zone_minutes = [
+            (zone,
+             zone.start.hour * 60 + zone.start.minute,
+             zone.end.hour * 60 + zone.end.minute)
+            for zone in base_zones
+        ]
+
         for day in range(days):
-            day_start = start_date + timedelta(days=day)
-            for zone in base_zones:
+            day_offset = day * MINUTES_PER_DAY
+            for zone, start_minute, end_minute in zone_minutes:
                 # Create new zone with same properties but adjusted date
                 new_zone = TimeBlockZone(
-                    start=day_start.replace(hour=zone.start.hour, minute=zone.start.minute),
-                    end=day_start.replace(hour=zone.end.hour, minute=zone.end.minute),
+                    start=origin + timedelta(minutes=day_offset + start_minute),
+                    end=origin + timedelta(minutes=day_offset + end_minute),
                     zone_type=zone.zone_type,
                     energy_level=zone.energy_level,
                     min_duration=zone.min_duration,
-                    buffer_required=zone.buffer_required,
-                    events=[]
+                    buffer_required=zone.buffer_required
                 )
                 multi_day_zones.append(new_zone)
         
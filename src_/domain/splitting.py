@@ -1,8 +1,18 @@
+import logging
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
+from operator import attrgetter
 from typing import List, Optional
-from .task import Task, ZoneType, EnergyLevel
-from .timeblock import TimeBlockZone, Event, TimeBlockType  # Added Event and TimeBlockType
+from .task import ZoneType, EnergyLevel
+from .timeblock import TimeBlockZone
+
+logger = logging.getLogger(__name__)
+
+def _energy_cost(zone_type: ZoneType, energy_level: EnergyLevel) -> float:
+    """Energy expenditure of working in a zone; DEEP work costs more unless energy is HIGH"""
+    if zone_type == ZoneType.DEEP:
+        return 0.7 if energy_level == EnergyLevel.HIGH else 0.9
+    return 0.5  # Base cost
 
 @dataclass
 class SplitMetrics:
@@ -15,12 +25,31 @@ class SplitMetrics:
 @dataclass
 class ChunkPlacement:
     """Represents a potential placement for a task chunk"""
+    __slots__ = ('start_time', 'duration', 'zone_id', 'energy_cost', 'context_switches')
+
     start_time: datetime
     duration: int
     zone_id: str
     energy_cost: float  # 0-1 representing energy expenditure
     context_switches: int  # Number of context switches this placement causes
 
+def _zone_placements(zones: List[TimeBlockZone]) -> List[ChunkPlacement]:
+    """One placement per zone, sorted by energy cost (lower is better), then chronologically"""
+    placements = []
+    
+    # Sort zones chronologically
+    for zone in sorted(zones, key=attrgetter('start')):
+        placements.append(ChunkPlacement(
+            start_time=zone.start,
+            duration=zone.duration_minutes,  # Available duration in whole minutes
+            zone_id=str(id(zone)),  # Using object id as temporary zone id
+            energy_cost=_energy_cost(zone.zone_type, zone.energy_level),
+            context_switches=0  # Simplified: no switches within a zone
+        ))
+    
+    # Sort placements by energy cost (lower is better)
+    return sorted(placements, key=attrgetter('energy_cost'))
+
 class SplitStrategy:
     """Determines optimal task splitting strategy based on available zones"""
     
@@ -46,20 +75,31 @@ class SplitStrategy:
         if not available_zones or total_duration <= 0:
             return None
         
-        print("\n=== Split Strategy Calculation ===")
-        print(f"Total duration: {total_duration} minutes")
-        print(f"Min chunk duration: {min_chunk_duration} minutes")
-        print(f"Max splits allowed: {max_splits}")
-        
         # Calculate optimal chunks based on preferred chunk size
         preferred_chunk_size = 120  # 2 hours
+
+        # A task that fits in one preferred chunk is never split, so the
+        # zone analysis below cannot change the answer
+        if total_duration <= preferred_chunk_size and max_splits >= 0:
+            return SplitMetrics(
+                optimal_chunk_count=1,
+                chunk_duration=total_duration,
+                total_buffer_time=15 * 2,  # 15 mins before and after the chunk
+                zone_utilization=1.0
+            )
+
+        logger.debug("=== Split Strategy Calculation ===")
+        logger.debug("Total duration: %s minutes", total_duration)
+        logger.debug("Min chunk duration: %s minutes", min_chunk_duration)
+        logger.debug("Max splits allowed: %s", max_splits)
+        
         optimal_chunks = max(1, -(-total_duration // preferred_chunk_size))
         optimal_chunks = min(optimal_chunks, max_splits + 1)
         chunk_duration = -(-total_duration // optimal_chunks)
         
-        print(f"\nChunk Calculation:")
-        print(f"Optimal chunks: {optimal_chunks}")
-        print(f"Chunk duration: {chunk_duration} minutes")
+        logger.debug("Chunk Calculation:")
+        logger.debug("Optimal chunks: %s", optimal_chunks)
+        logger.debug("Chunk duration: %s minutes", chunk_duration)
         
         # Calculate buffer times:
         # 1. Between chunks
@@ -68,30 +108,29 @@ class SplitStrategy:
         existing_events_buffer = optimal_chunks * (15 * 2)  # 15 mins before and after each chunk
         total_buffer = between_chunks_buffer + existing_events_buffer
         
-        # Get morning DEEP work zones, sorted by start time
-        morning_deep_zones = sorted(
-            [z for z in available_zones 
-             if z.zone_type == ZoneType.DEEP and z.start.hour == 9],
-            key=lambda z: z.start
+        # Count morning DEEP work zones; only the count is used
+        morning_deep_zone_count = sum(
+            1 for z in available_zones
+            if z.zone_type == ZoneType.DEEP and z.start.hour == 9
         )
         
         # Calculate usable capacity based on chunk duration
         zones_needed = optimal_chunks
         usable_zone_capacity = zones_needed * chunk_duration  # Only count the time we'll actually use
         
-        print(f"\nZone Analysis:")
-        print(f"Morning DEEP zones available: {len(morning_deep_zones)}")
-        print(f"Zones needed: {zones_needed}")
-        print(f"Usable zone capacity: {usable_zone_capacity} minutes")
+        logger.debug("Zone Analysis:")
+        logger.debug("Morning DEEP zones available: %s", morning_deep_zone_count)
+        logger.debug("Zones needed: %s", zones_needed)
+        logger.debug("Usable zone capacity: %s minutes", usable_zone_capacity)
         
         # Calculate utilization based on actual chunk usage
         zone_utilization = (total_duration / usable_zone_capacity 
                            if usable_zone_capacity > 0 else 0)
         
-        print(f"\nUtilization Analysis:")
-        print(f"Total required time (task only): {total_duration} minutes")
-        print(f"Total buffer time: {total_buffer} minutes")
-        print(f"Zone utilization: {zone_utilization:.2f}")
+        logger.debug("Utilization Analysis:")
+        logger.debug("Total required time (task only): %s minutes", total_duration)
+        logger.debug("Total buffer time: %s minutes", total_buffer)
+        logger.debug("Zone utilization: %.2f", zone_utilization)
         
         metrics = SplitMetrics(
             optimal_chunk_count=optimal_chunks,
@@ -100,11 +139,11 @@ class SplitStrategy:
             zone_utilization=min(zone_utilization, 1.0)
         )
         
-        print(f"\nFinal Metrics:")
-        print(f"Chunks: {metrics.optimal_chunk_count}")
-        print(f"Duration per chunk: {metrics.chunk_duration} minutes")
-        print(f"Buffer time: {metrics.total_buffer_time} minutes")
-        print(f"Utilization: {metrics.zone_utilization:.2f}")
+        logger.debug("Final Metrics:")
+        logger.debug("Chunks: %s", metrics.optimal_chunk_count)
+        logger.debug("Duration per chunk: %s minutes", metrics.chunk_duration)
+        logger.debug("Buffer time: %s minutes", metrics.total_buffer_time)
+        logger.debug("Utilization: %.2f", metrics.zone_utilization)
         
         return metrics
 
@@ -125,33 +164,5 @@ class SplitStrategy:
         """
         if not zones:
             return []
-            
-        placements = []
-        
-        # Sort zones chronologically
-        sorted_zones = sorted(zones, key=lambda z: z.start)
-        
-        for zone in sorted_zones:
-            # Calculate available duration
-            available_duration = int((zone.end - zone.start).total_seconds() / 60)
-            
-            # Calculate energy cost based on zone type and energy level
-            energy_cost = 0.5  # Base cost
-            if zone.zone_type == ZoneType.DEEP:
-                energy_cost = 0.7 if zone.energy_level == EnergyLevel.HIGH else 0.9
-            
-            # Calculate context switches (simplified version)
-            context_switches = 0
-            
-            placement = ChunkPlacement(
-                start_time=zone.start,
-                duration=available_duration,
-                zone_id=str(id(zone)),  # Using object id as temporary zone id
-                energy_cost=energy_cost,
-                context_switches=context_switches
-            )
-            
-            placements.append(placement)
-        
-        # Sort placements by energy cost (lower is better)
-        return sorted(placements, key=lambda p: p.energy_cost)
\ No newline at end of file
+
+        return _zone_placements(zones)
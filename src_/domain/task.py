@@ -1,17 +1,18 @@
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
-from typing import List, Optional
+from enum import IntEnum
+from typing import Iterator, List, Optional, Sequence
 
-class ZoneType(Enum):
-    DEEP = "deep"
-    LIGHT = "light"
-    ADMIN = "admin"
+class ZoneType(IntEnum):
+    DEEP = 1
+    LIGHT = 2
+    ADMIN = 3
 
-class EnergyLevel(Enum):
-    HIGH = "high"
-    MEDIUM = "medium"
-    LOW = "low"
+class EnergyLevel(IntEnum):
+    # Ordered so that a lower value means less energy
+    HIGH = 3
+    MEDIUM = 2
+    LOW = 1
 
 """
 Domain model for Tasks in the intelligent time-blocking system.
@@ -52,13 +53,16 @@ class TaskConstraints:
     - required_buffer ensures spacing between tasks
     - dependencies enforce task execution order
     """
+    __slots__ = ('zone_type', 'energy_level', 'is_splittable', 'min_chunk_duration',
+                 'max_split_count', 'required_buffer', 'dependencies')
+
     zone_type: ZoneType
     energy_level: EnergyLevel
     is_splittable: bool
     min_chunk_duration: int  # in minutes
     max_split_count: int
     required_buffer: int  # in minutes
-    dependencies: List[str]  # task IDs
+    dependencies: Sequence[str]  # task IDs, () when there are none
 
 @dataclass
 class Task:
@@ -79,6 +83,9 @@ class Task:
     - Split tasks inherit most constraints but cannot be split further
     - Split tasks maintain sequential dependencies
     """
+    __slots__ = ('id', 'title', 'duration', 'due_date', 'project_id',
+                 'sequence_number', 'constraints')
+
     id: str
     title: str
     duration: int  # in minutes
@@ -87,28 +94,32 @@ class Task:
     sequence_number: int  # Position in Todoist project
     constraints: TaskConstraints
 
-    def validate(self) -> List[str]:
-        """Validates all task properties"""
-        errors = []
-        
+    def validate_iter(self) -> Iterator[str]:
+        """Yields validation errors lazily, in the same order as validate()"""
         if self.duration <= 0:
-            errors.append("Task duration must be positive")
+            yield "Task duration must be positive"
             
         if self.due_date < datetime.now():
-            errors.append("Due date cannot be in the past")
+            yield "Due date cannot be in the past"
             
         if self.sequence_number < 0:
-            errors.append("Sequence number must be non-negative")
+            yield "Sequence number must be non-negative"
 
         if self.constraints.is_splittable:
             total_min_duration = self.constraints.min_chunk_duration * self.constraints.max_split_count
             if total_min_duration > self.duration:
-                errors.append(
+                yield (
                     f"Total minimum chunk duration ({total_min_duration} min) "
                     f"exceeds task duration ({self.duration} min)"
                 )
-                
-        return errors
+
+    def is_valid(self) -> bool:
+        """Returns True if the task has no validation errors, stopping at the first one"""
+        return next(self.validate_iter(), None) is None
+
+    def validate(self) -> List[str]:
+        """Validates all task properties"""
+        return list(self.validate_iter())
 
     def get_minimum_duration(self) -> int:
         """Returns the minimum duration needed for a single block"""
@@ -145,14 +156,14 @@ class Task:
         base_sequence = self.sequence_number * 1000  # Create space for chunks in sequence
 
         for i, size in enumerate(chunk_sizes, 1):
-            # Set up dependencies for this chunk
-            chunk_dependencies = []
+            # Set up dependencies for this chunk; tuples let chunks without
+            # dependencies share the empty tuple
             if i == 1:
                 # First chunk inherits original task's dependencies
-                chunk_dependencies = self.constraints.dependencies.copy()
+                chunk_dependencies = tuple(self.constraints.dependencies)
             else:
                 # Other chunks depend on the previous chunk
-                chunk_dependencies = [f"{self.id}_chunk_{i-1}"]
+                chunk_dependencies = (f"{self.id}_chunk_{i-1}",)
 
             chunk = Task(
                 id=f"{self.id}_chunk_{i}",
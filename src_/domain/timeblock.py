@@ -1,9 +1,9 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from enum import Enum
-from typing import List, Optional
+from enum import Enum, IntEnum
+from typing import List, Optional, Sequence
 
-from .task import ZoneType, EnergyLevel
+from .task import Task, ZoneType, EnergyLevel
 
 """
 Time block management for task scheduling.
@@ -32,12 +32,16 @@ System Constraints:
 - Events must fit within block boundaries
 """
 
-class TimeBlockType(Enum):
-    FIXED = "fixed"
-    MANAGED = "managed"
-    ZONE = "zone"
+ONE_MINUTE = timedelta(minutes=1)
+
+class TimeBlockType(IntEnum):
+    FIXED = 1
+    MANAGED = 2
+    ZONE = 3
 
 class Event:
+    __slots__ = ('id', 'start', 'end', 'title', 'type', 'buffer_required')
+
     def __init__(self, id: str, start: datetime, end: datetime, 
                  title: str, type: TimeBlockType, buffer_required: int = 0):
         self.id = id
@@ -47,12 +51,23 @@ class Event:
         self.type = type
         self.buffer_required = buffer_required  # New field for buffer requirements
 
+    @property
+    def duration_minutes(self) -> int:
+        """Whole minutes between start and end"""
+        return (self.end - self.start) // ONE_MINUTE
+
 @dataclass
 class TimeBlock:
     start: datetime
     end: datetime
     type: TimeBlockType
-    events: List[Event] = field(default_factory=list)
+    events: Sequence[Event] = ()
+
+    def add_event(self, event: Event) -> None:
+        """Adds an event, switching read-only tuple storage to a list on first use"""
+        if not isinstance(self.events, list):
+            self.events = list(self.events)
+        self.events.append(event)
 
     def is_available(self, start: datetime, duration: int) -> bool:
         if start < self.start or start + timedelta(minutes=duration) > self.end:
@@ -75,7 +90,18 @@ class TimeBlockZone:
     min_duration: int  # in minutes
     buffer_required: int  # in minutes
     type: TimeBlockType = TimeBlockType.ZONE
-    events: List[Event] = field(default_factory=list)
+    events: Sequence[Event] = ()
+
+    @property
+    def duration_minutes(self) -> int:
+        """Whole minutes between start and end"""
+        return (self.end - self.start) // ONE_MINUTE
+
+    def add_event(self, event: Event) -> None:
+        """Adds an event, switching read-only tuple storage to a list on first use"""
+        if not isinstance(self.events, list):
+            self.events = list(self.events)
+        self.events.append(event)
 
     def is_available(self, start: datetime, duration: int) -> bool:
         # Check if duration meets minimum requirement
@@ -129,7 +155,7 @@ class AdminTimeBlockZone(TimeBlockZone):
         start: datetime,
         end: datetime,
         admin_config: AdminZoneConfig,
-        events: List[Event] = None
+        events: Sequence[Event] = ()
     ):
         super().__init__(
             start=start,
@@ -138,7 +164,7 @@ class AdminTimeBlockZone(TimeBlockZone):
             energy_level=EnergyLevel.MEDIUM,
             min_duration=15,
             buffer_required=admin_config.required_buffer,
-            events=events or []
+            events=events
         )
         self.admin_config = admin_config
 
@@ -0,0 +1,62 @@
+import pytest
+from datetime import datetime, timedelta
+from src_.domain.task import ZoneType, EnergyLevel
+from src_.domain.timeblock import TimeBlockZone
+
+"""
+Shared zone fixtures for the scheduling test modules.
+
+Zones are built once per session (once per worker under pytest-xdist) and
+carry no events, so tests must treat them as read-only and derive their
+own copies with dataclasses.replace() when they need different settings.
+"""
+
+# Modules whose tests share module-scoped scheduler fixtures. Under
+# pytest-xdist, run with `pytest -n auto --dist=loadgroup` so each module
+# stays on one worker and builds its fixtures once.
+XDIST_GROUPS = {
+    "test_rescheduling.py": "scheduler",
+    "test_rescheduling2.py": "rescheduling2",
+}
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "xdist_group(name): keep tests on one pytest-xdist worker"
+    )
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        group = XDIST_GROUPS.get(item.path.name)
+        if group:
+            item.add_marker(pytest.mark.xdist_group(group))
+
+@pytest.fixture(scope="session")
+def fixed_start():
+    """Monday 9:00 AM, the start of the working day for shared zones"""
+    return datetime(2024, 1, 1, 9, 0)
+
+@pytest.fixture(scope="session")
+def deep_zone(fixed_start):
+    """Morning DEEP/HIGH zone, 9:00 AM - 1:00 PM"""
+    return TimeBlockZone(
+        start=fixed_start,
+        end=fixed_start + timedelta(hours=4),
+        zone_type=ZoneType.DEEP,
+        energy_level=EnergyLevel.HIGH,
+        min_duration=30,
+        buffer_required=15,
+        events=()
+    )
+
+@pytest.fixture(scope="session")
+def light_zone(fixed_start):
+    """Afternoon LIGHT/MEDIUM zone, 1:00 PM - 5:00 PM"""
+    return TimeBlockZone(
+        start=fixed_start + timedelta(hours=4),
+        end=fixed_start + timedelta(hours=8),
+        zone_type=ZoneType.LIGHT,
+        energy_level=EnergyLevel.MEDIUM,
+        min_duration=30,
+        buffer_required=15,
+        events=()
+    )
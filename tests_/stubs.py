@@ -0,0 +1,31 @@
+"""
+In-memory repository stubs shared by the scheduler test modules.
+"""
+
+class MockTaskRepository:
+    """Serves a fixed task list"""
+    def __init__(self, tasks=None):
+        self.tasks = tasks or []
+
+    def get_tasks(self):
+        return self.tasks
+
+    def mark_scheduled(self, task_id):
+        pass
+
+class MockCalendarRepository:
+    """Empty calendar that serves a fixed set of zones"""
+    def __init__(self, zones=None):
+        self.zones = zones or []
+
+    def get_events(self, start, end):
+        return []
+
+    def create_event(self, event):
+        return "new_event_id"
+
+    def remove_managed_events(self):
+        pass
+
+    def get_zones(self, start, end):
+        return self.zones
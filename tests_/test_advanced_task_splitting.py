@@ -1,10 +1,14 @@
+import logging
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 import pytest
 from src_.domain.task import Task, TaskConstraints, ZoneType, EnergyLevel
 from src_.domain.scheduling.strategies import SequenceBasedStrategy
 from src_.domain.timeblock import TimeBlockZone
 from src_.domain.scheduler import Scheduler
+from stubs import MockCalendarRepository, MockTaskRepository
+
+logger = logging.getLogger(__name__)
 
 @pytest.fixture
 def work_day_zones():
@@ -17,7 +21,7 @@ def work_day_zones():
             energy_level=EnergyLevel.HIGH,
             min_duration=30,
             buffer_required=15,
-            events=[]
+            events=()
         ),
         TimeBlockZone(
             start=start_time + timedelta(hours=4),
@@ -26,25 +30,16 @@ def work_day_zones():
             energy_level=EnergyLevel.MEDIUM,
             min_duration=30,
             buffer_required=15,
-            events=[]
+            events=()
         )
     ]
 
 @pytest.fixture
 def scheduler(work_day_zones):
-    task_repo = Mock()
-    calendar_repo = Mock()
-    strategy = SequenceBasedStrategy()
-    
-    # Configure mock behavior
-    calendar_repo.get_events.return_value = []
-    calendar_repo.get_zones.return_value = work_day_zones
-    task_repo.get_tasks.return_value = []
-    
     return Scheduler(
-        task_repo=task_repo,
-        calendar_repo=calendar_repo,
-        strategy=strategy
+        task_repo=MockTaskRepository(),
+        calendar_repo=MockCalendarRepository(work_day_zones),
+        strategy=SequenceBasedStrategy()
     )
 
 def test_reschedule_splits_tasks_when_necessary(scheduler, work_day_zones):
@@ -119,7 +114,7 @@ def test_reschedule_splits_tasks_when_necessary(scheduler, work_day_zones):
                 min_chunk_duration=60,  # 1 hour minimum
                 max_split_count=4,
                 required_buffer=15,
-                dependencies=[]
+                dependencies=()
             )
         )
 
@@ -132,7 +127,7 @@ def test_reschedule_splits_tasks_when_necessary(scheduler, work_day_zones):
                 energy_level=EnergyLevel.HIGH,
                 min_duration=30,
                 buffer_required=15,
-                events=[]
+                events=()
             ),
             TimeBlockZone(
                 start=(reference_date + timedelta(days=1)).replace(hour=9),  # Jan 2, 9 AM
@@ -141,12 +136,12 @@ def test_reschedule_splits_tasks_when_necessary(scheduler, work_day_zones):
                 energy_level=EnergyLevel.HIGH,
                 min_duration=30,
                 buffer_required=15,
-                events=[]
+                events=()
             )
         ]
 
-        # Override the calendar repository's get_zones
-        scheduler.calendar_repo.get_zones.return_value = test_zones
+        # Override the calendar repository's zones
+        scheduler.calendar_repo.zones = tuple(test_zones)
 
         # When: Scheduling the task
         result = scheduler.reschedule([task])
@@ -159,15 +154,15 @@ def test_reschedule_splits_tasks_when_necessary(scheduler, work_day_zones):
         sorted_events = sorted(split_events, key=lambda e: e.start)
         
         # Debug output
-        print("\nAvailable Zones:")
+        logger.debug("Available Zones:")
         for zone in test_zones:
-            print(f"Zone: {zone.start.strftime('%Y-%m-%d %H:%M')} - {zone.end.strftime('%H:%M')} "
-                  f"({zone.zone_type}, {zone.energy_level})")
+            logger.debug("Zone: %s - %s (%s, %s)",
+                         zone.start, zone.end, zone.zone_type.name, zone.energy_level.name)
         
-        print("\nScheduled Events:")
+        logger.debug("Scheduled Events:")
         for event in sorted_events:
-            print(f"Event {event.id}: {event.start.strftime('%Y-%m-%d %H:%M')} - {event.end.strftime('%H:%M')} "
-                  f"(duration: {(event.end - event.start).total_seconds() / 60} min)")
+            logger.debug("Event %s: %s - %s (duration: %s min)",
+                         event.id, event.start, event.end, event.duration_minutes)
 
         # Verify first chunk
         first_chunk = sorted_events[0]
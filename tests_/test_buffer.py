@@ -1,15 +1,20 @@
+import dataclasses
 import pytest
 from datetime import datetime, timedelta
 from src_.domain.task import Task, TaskConstraints, ZoneType, EnergyLevel
 from src_.domain.scheduler import Scheduler, SchedulingStrategy
-from src_.domain.timeblock import TimeBlockZone, Event, TimeBlockType
+from src_.domain.timeblock import Event, TimeBlockType
+
+TD_MIN = timedelta(minutes=1)
 
 class BufferAwareStrategy(SchedulingStrategy):
     def schedule(self, tasks, zones, existing_events):
         events = []
         current_time = zones[0].start if zones else datetime.now()
         
-        for i, task in enumerate(tasks):
+        # Pair each task with its successor (None for the last one);
+        # itertools.pairwise needs Python 3.10
+        for task, next_task in zip(tasks, tasks[1:] + [None]):
             # Find appropriate zone
             zone = next((z for z in zones if z.zone_type == task.constraints.zone_type), None)
             if not zone:
@@ -18,15 +23,14 @@ class BufferAwareStrategy(SchedulingStrategy):
             event = Event(
                 id=task.id,
                 start=current_time,
-                end=current_time + timedelta(minutes=task.duration),
+                end=current_time + TD_MIN * task.duration,
                 title=task.title,
                 type=TimeBlockType.MANAGED
             )
             events.append(event)
             
             # Add appropriate buffer
-            if i < len(tasks) - 1:  # If there's a next task
-                next_task = tasks[i + 1]
+            if next_task is not None:
                 # Use maximum buffer between current and next task
                 buffer = max(
                     task.constraints.required_buffer,
@@ -38,7 +42,7 @@ class BufferAwareStrategy(SchedulingStrategy):
             else:
                 buffer = task.constraints.required_buffer
                 
-            current_time = event.end + timedelta(minutes=buffer)
+            current_time = event.end + TD_MIN * buffer
         
         return events
 
@@ -75,32 +79,11 @@ class TestBufferManagement:
             min_chunk_duration=30,
             max_split_count=1,
             required_buffer=15,
-            dependencies=[]
-        )
-
-    def test_maintains_buffer_between_different_zone_types(self, default_constraints):
-        # Create time blocks for different zones
-        start_time = datetime.now().replace(hour=9, minute=0)
-        deep_zone = TimeBlockZone(
-            start=start_time,
-            end=start_time + timedelta(hours=4),
-            zone_type=ZoneType.DEEP,
-            energy_level=EnergyLevel.HIGH,
-            min_duration=30,
-            buffer_required=15,
-            events=[]
-        )
-        
-        light_zone = TimeBlockZone(
-            start=start_time,
-            end=start_time + timedelta(hours=4),
-            zone_type=ZoneType.LIGHT,
-            energy_level=EnergyLevel.MEDIUM,
-            min_duration=30,
-            buffer_required=15,
-            events=[]
+            dependencies=()
         )
 
+    def test_maintains_buffer_between_different_zone_types(self, default_constraints,
+                                                           deep_zone, light_zone):
         deep_task = Task(
             id="deep",
             title="Deep Task",
@@ -115,7 +98,7 @@ class TestBufferManagement:
                 min_chunk_duration=30,
                 max_split_count=1,
                 required_buffer=15,
-                dependencies=[]
+                dependencies=()
             )
         )
 
@@ -133,7 +116,7 @@ class TestBufferManagement:
                 min_chunk_duration=30,
                 max_split_count=1,
                 required_buffer=15,
-                dependencies=[]
+                dependencies=()
             )
         )
         
@@ -142,23 +125,13 @@ class TestBufferManagement:
         events = strategy.schedule([deep_task, light_task], [deep_zone, light_zone], [])
         
         # Verify minimum transition buffer between different zones
-        deep_event = next(e for e in events if e.id == "deep")
-        light_event = next(e for e in events if e.id == "light")
+        by_id = {e.id: e for e in events}
+        deep_event = by_id["deep"]
+        light_event = by_id["light"]
         buffer = int((light_event.start - deep_event.end).total_seconds() / 60)  # Convert to minutes
         assert buffer >= 30  # Transition buffer
 
-    def test_respects_task_specific_buffer_requirements(self, default_constraints):
-        start_time = datetime.now().replace(hour=9, minute=0)
-        deep_zone = TimeBlockZone(
-            start=start_time,
-            end=start_time + timedelta(hours=4),
-            zone_type=ZoneType.DEEP,
-            energy_level=EnergyLevel.HIGH,
-            min_duration=30,
-            buffer_required=15,
-            events=[]
-        )
-
+    def test_respects_task_specific_buffer_requirements(self, default_constraints, deep_zone):
         task1 = Task(
             id="task1",
             title="Task 1",
@@ -166,9 +139,7 @@ class TestBufferManagement:
             due_date=datetime.now() + timedelta(days=1),
             sequence_number=1,  # Changed from priority
             project_id="test",
-            constraints=TaskConstraints(
-                **{**default_constraints.__dict__, "required_buffer": 15}
-            )
+            constraints=dataclasses.replace(default_constraints, required_buffer=15)
         )
 
         task2 = Task(
@@ -178,9 +149,7 @@ class TestBufferManagement:
             due_date=datetime.now() + timedelta(days=1),
             sequence_number=1,  # Changed from priority
             project_id="test",
-            constraints=TaskConstraints(
-                **{**default_constraints.__dict__, "required_buffer": 30}
-            )
+            constraints=dataclasses.replace(default_constraints, required_buffer=30)
         )
         
         # Use direct scheduling instead of Scheduler
@@ -188,7 +157,8 @@ class TestBufferManagement:
         events = strategy.schedule([task1, task2], [deep_zone], [])
         
         # Verify buffer between tasks
-        task1_event = next(e for e in events if e.id == "task1")
-        task2_event = next(e for e in events if e.id == "task2")
+        by_id = {e.id: e for e in events}
+        task1_event = by_id["task1"]
+        task2_event = by_id["task2"]
         buffer = int((task2_event.start - task1_event.end).total_seconds() / 60)  # Convert to minutes
         assert buffer >= 30  # Uses larger buffer requirement
\ No newline at end of file
@@ -1,9 +1,10 @@
+from dataclasses import replace
 from datetime import datetime
 from src_.domain.task import Task, TaskConstraints, ZoneType, EnergyLevel
 from src_.domain.timeblock import TimeBlockZone
 from src_.domain.conflict import ConflictDetector
 
-def test_zone_transition_conflicts():
+def test_zone_transition_conflicts(deep_zone, light_zone):
     """
     Test detection of conflicts when tasks cross time block zone boundaries.
     
@@ -18,13 +19,13 @@ def test_zone_transition_conflicts():
     
     - Two adjacent time zones:
         Zone 1 (DEEP/HIGH):
-            * 10:00 AM - 12:00 PM
+            * 9:00 AM - 1:00 PM
             * DEEP work, HIGH energy
             * 30-min minimum duration
             * 15-min buffer required
             
         Zone 2 (LIGHT/MEDIUM):
-            * 12:00 PM - 2:00 PM
+            * 1:00 PM - 5:00 PM
             * LIGHT work, MEDIUM energy
             * 30-min minimum duration
             * 15-min buffer required
@@ -32,13 +33,13 @@ def test_zone_transition_conflicts():
     Test Cases:
     -----------
     1. Incompatible Zone Transition:
-       - Start task at 11:00 AM (in Zone 1)
-       - Task would cross into Zone 2 at 12:00 PM
+       - Start task at 12:00 PM (in Zone 1)
+       - Task would cross into Zone 2 at 1:00 PM
        - Expected: Conflict detected due to incompatible zone types (DEEP → LIGHT)
        
     2. Compatible Zone Transition:
-       - Change Zone 2 to match Zone 1 (DEEP/HIGH)
-       - Start task at 11:00 AM
+       - Use a copy of Zone 2 matching Zone 1 (DEEP/HIGH)
+       - Start task at 12:00 PM
        - Expected: No conflict detected as zones are compatible
     
     Business Rules Verified:
@@ -70,35 +71,17 @@ def test_zone_transition_conflicts():
             min_chunk_duration=180,
             max_split_count=1,
             required_buffer=15,
-            dependencies=[]
+            dependencies=()
         )
     )
     
-    # And: Two adjacent zones with different types
-    zone1 = TimeBlockZone(
-        start=datetime(2024, 1, 1, 10),  # 10 AM
-        end=datetime(2024, 1, 1, 12),    # 12 PM
-        zone_type=ZoneType.DEEP,
-        energy_level=EnergyLevel.HIGH,
-        min_duration=30,
-        buffer_required=15,
-        events=[]
-    )
-    
-    zone2 = TimeBlockZone(
-        start=datetime(2024, 1, 1, 12),  # 12 PM
-        end=datetime(2024, 1, 1, 14),    # 2 PM
-        zone_type=ZoneType.LIGHT,
-        energy_level=EnergyLevel.MEDIUM,
-        min_duration=30,
-        buffer_required=15,
-        events=[]
-    )
+    # And: Two adjacent zones with different types (shared, read-only)
+    zone1, zone2 = deep_zone, light_zone
     
     # When: Checking for conflicts with incompatible zones
     conflict = ConflictDetector.find_zone_transition_conflicts(
         task,
-        datetime(2024, 1, 1, 11),  # Start at 11 AM
+        datetime(2024, 1, 1, 12),  # Start at 12 PM
         [zone1, zone2]
     )
     
@@ -110,14 +93,120 @@ def test_zone_transition_conflicts():
     assert conflict.end_zone == zone2, "End zone should be Zone 2"
     
     # When: Zones have same type and energy level
-    zone2.zone_type = ZoneType.DEEP
-    zone2.energy_level = EnergyLevel.HIGH
+    zone2 = replace(zone2, zone_type=ZoneType.DEEP, energy_level=EnergyLevel.HIGH)
     
     conflict = ConflictDetector.find_zone_transition_conflicts(
         task,
-        datetime(2024, 1, 1, 11),  # Start at 11 AM
+        datetime(2024, 1, 1, 12),  # Start at 12 PM
         [zone1, zone2]
     )
     
     # Then: Should not detect conflict for compatible zones
-    assert conflict is None, "Should not detect conflict when zones are compatible"
\ No newline at end of file
+    assert conflict is None, "Should not detect conflict when zones are compatible"
+
+def test_zone_transition_conflicts_across_week_of_zones():
+    """
+    Start-zone lookup must pick the right zone out of a full week of zones,
+    regardless of the order zones are passed in.
+    """
+    task = Task(
+        id="week_task",
+        title="Week Task",
+        duration=90,
+        due_date=datetime(2024, 1, 8, 17),
+        project_id="proj1",
+        sequence_number=1,
+        constraints=TaskConstraints(
+            zone_type=ZoneType.DEEP,
+            energy_level=EnergyLevel.HIGH,
+            is_splittable=False,
+            min_chunk_duration=90,
+            max_split_count=1,
+            required_buffer=15,
+            dependencies=()
+        )
+    )
+
+    zones = []
+    for day in range(1, 8):
+        zones.append(TimeBlockZone(
+            start=datetime(2024, 1, day, 9),
+            end=datetime(2024, 1, day, 11),
+            zone_type=ZoneType.DEEP,
+            energy_level=EnergyLevel.HIGH,
+            min_duration=30,
+            buffer_required=15,
+            events=()
+        ))
+        zones.append(TimeBlockZone(
+            start=datetime(2024, 1, day, 11),
+            end=datetime(2024, 1, day, 13),
+            zone_type=ZoneType.LIGHT,
+            energy_level=EnergyLevel.MEDIUM,
+            min_duration=30,
+            buffer_required=15,
+            events=()
+        ))
+    zones.reverse()
+
+    # Fits entirely inside Wednesday's DEEP zone
+    assert ConflictDetector.find_zone_transition_conflicts(
+        task, datetime(2024, 1, 3, 9), zones
+    ) is None
+
+    # Crosses from Wednesday's DEEP zone into its LIGHT zone
+    conflict = ConflictDetector.find_zone_transition_conflicts(
+        task, datetime(2024, 1, 3, 10), zones
+    )
+    assert conflict is not None
+    assert conflict.start_zone.start == datetime(2024, 1, 3, 9)
+    assert conflict.end_zone.start == datetime(2024, 1, 3, 11)
+
+    # Falls in the gap between Wednesday and Thursday
+    conflict = ConflictDetector.find_zone_transition_conflicts(
+        task, datetime(2024, 1, 3, 14), zones
+    )
+    assert conflict.message == "No valid starting zone found"
+
+def test_zone_transition_prefers_first_listed_zone_for_shared_start():
+    """Zones sharing a start resolve to the first listed one containing start_time"""
+    task = Task(
+        id="task1",
+        title="Deep Work Task",
+        duration=60,
+        due_date=datetime(2024, 1, 2),
+        project_id="proj1",
+        sequence_number=1,
+        constraints=TaskConstraints(
+            zone_type=ZoneType.DEEP,
+            energy_level=EnergyLevel.HIGH,
+            is_splittable=False,
+            min_chunk_duration=30,
+            max_split_count=1,
+            required_buffer=15,
+            dependencies=()
+        )
+    )
+    short_deep = TimeBlockZone(
+        start=datetime(2024, 1, 1, 9),
+        end=datetime(2024, 1, 1, 10),
+        zone_type=ZoneType.DEEP,
+        energy_level=EnergyLevel.HIGH,
+        min_duration=30,
+        buffer_required=15,
+        events=()
+    )
+    long_light = replace(short_deep, end=datetime(2024, 1, 1, 13),
+                         zone_type=ZoneType.LIGHT, energy_level=EnergyLevel.MEDIUM)
+
+    # Both zones contain 9:30; the DEEP zone is listed first and ends at 10:00
+    conflict = ConflictDetector.find_zone_transition_conflicts(
+        task, datetime(2024, 1, 1, 9, 30), [short_deep, long_light]
+    )
+    assert conflict.start_zone is short_deep
+    assert conflict.end_zone is long_light
+
+    # Only the LIGHT zone contains 10:15, and the task fits inside it
+    assert ConflictDetector.find_zone_transition_conflicts(
+        task, datetime(2024, 1, 1, 10, 15), [short_deep, long_light]
+    ) is None
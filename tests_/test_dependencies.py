@@ -1,3 +1,4 @@
+import dataclasses
 import pytest
 from datetime import datetime, timedelta
 from src_.domain.task import Task, TaskConstraints, ZoneType, EnergyLevel
@@ -70,7 +71,7 @@ class TestTaskDependencies:
             min_chunk_duration=30,
             max_split_count=1,
             required_buffer=15,
-            dependencies=[]
+            dependencies=()
         )
 
     def test_respects_task_dependencies(self, default_constraints):
@@ -81,9 +82,7 @@ class TestTaskDependencies:
             due_date=datetime.now() + timedelta(days=1),
             sequence_number=1,  # Changed from priority
             project_id="test",
-            constraints=TaskConstraints(
-                **{**default_constraints.__dict__, "dependencies": []}
-            )
+            constraints=dataclasses.replace(default_constraints, dependencies=())
         )
 
         task2 = Task(
@@ -93,9 +92,7 @@ class TestTaskDependencies:
             due_date=datetime.now() + timedelta(days=1),
             sequence_number=2,  # Changed from priority
             project_id="test",
-            constraints=TaskConstraints(
-                **{**default_constraints.__dict__, "dependencies": ["task1"]}
-            )
+            constraints=dataclasses.replace(default_constraints, dependencies=("task1",))
         )
 
         task3 = Task(
@@ -105,9 +102,7 @@ class TestTaskDependencies:
             due_date=datetime.now() + timedelta(days=1),
             sequence_number=3,  # Changed from priority
             project_id="test",
-            constraints=TaskConstraints(
-                **{**default_constraints.__dict__, "dependencies": ["task2"]}
-            )
+            constraints=dataclasses.replace(default_constraints, dependencies=("task2",))
         )
 
         strategy = DependencyAwareStrategy()
@@ -118,13 +113,14 @@ class TestTaskDependencies:
             energy_level=EnergyLevel.HIGH,
             min_duration=30,
             buffer_required=15,
-            events=[]
+            events=()
         )], [])
         
         # Verify correct ordering
-        task1_event = next(e for e in events if e.id == "task1")
-        task2_event = next(e for e in events if e.id == "task2")
-        task3_event = next(e for e in events if e.id == "task3")
+        by_id = {e.id: e for e in events}
+        task1_event = by_id["task1"]
+        task2_event = by_id["task2"]
+        task3_event = by_id["task3"]
         
         assert task1_event.end <= task2_event.start
         assert task2_event.end <= task3_event.start
@@ -137,9 +133,7 @@ class TestTaskDependencies:
             due_date=datetime.now() + timedelta(days=1),
             sequence_number=1,  # Changed from priority
             project_id="test",
-            constraints=TaskConstraints(
-                **{**default_constraints.__dict__, "dependencies": ["task2"]}
-            )
+            constraints=dataclasses.replace(default_constraints, dependencies=("task2",))
         )
 
         task2 = Task(
@@ -149,9 +143,7 @@ class TestTaskDependencies:
             due_date=datetime.now() + timedelta(days=1),
             sequence_number=2,  # Changed from priority
             project_id="test",
-            constraints=TaskConstraints(
-                **{**default_constraints.__dict__, "dependencies": ["task1"]}
-            )
+            constraints=dataclasses.replace(default_constraints, dependencies=("task1",))
         )
 
         strategy = DependencyAwareStrategy()
@@ -163,5 +155,5 @@ class TestTaskDependencies:
                 energy_level=EnergyLevel.HIGH,
                 min_duration=30,
                 buffer_required=15,
-                events=[]
+                events=()
             )], [])
@@ -1,15 +1,54 @@
 import pytest
+from dataclasses import replace
 from datetime import datetime, timedelta
-from typing import List
+from typing import Dict, List
 from src_.domain.task import Task, TaskConstraints, ZoneType, EnergyLevel
 from src_.domain.scheduler import Scheduler
 from src_.domain.timeblock import TimeBlockZone, Event, TimeBlockType
 from src_.domain.scheduling import SequenceBasedStrategy
-from unittest.mock import Mock
+from stubs import MockCalendarRepository, MockTaskRepository
 
-@pytest.fixture
+_DEEP_HIGH_CONSTRAINTS = TaskConstraints(
+    zone_type=ZoneType.DEEP,
+    energy_level=EnergyLevel.HIGH,
+    is_splittable=False,
+    min_chunk_duration=30,
+    max_split_count=1,
+    required_buffer=15,
+    dependencies=()
+)
+
+# Frozen "now" shared by the tests and the scheduler's clock
+_NOW = datetime(2024, 1, 1, 8, 0)
+_DUE = _NOW + timedelta(days=7)
+_MIN_BUFFER = timedelta(minutes=15)
+
+def _sequential_tasks(n: int) -> List[Task]:
+    """Builds n tasks in project order, each depending on the one before it"""
+    return [
+        Task(
+            id=f"task{i}",
+            title=f"Task {i}",
+            duration=60,
+            due_date=_DUE,
+            project_id="proj1",
+            sequence_number=i,
+            constraints=replace(
+                _DEEP_HIGH_CONSTRAINTS,
+                dependencies=(f"task{i - 1}",) if i > 1 else ()
+            )
+        )
+        for i in range(1, n + 1)
+    ]
+
+def _index_schedule(schedule: List[Event]) -> Dict[str, Event]:
+    """Index scheduled events by id so assertions don't rescan the schedule"""
+    return {e.id: e for e in schedule}
+
+@pytest.fixture(scope="module")
 def work_day_zones():
-    start_time = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
+    """Read-only zones shared by every test in the module"""
+    start_time = _NOW.replace(hour=9)
     return [
         TimeBlockZone(
             zone_type=ZoneType.DEEP,
@@ -18,7 +57,7 @@ def work_day_zones():
             energy_level=EnergyLevel.HIGH,
             min_duration=30,
             buffer_required=15,
-            events=[]
+            events=()
         ),
         TimeBlockZone(
             zone_type=ZoneType.LIGHT,
@@ -27,79 +66,48 @@ def work_day_zones():
             energy_level=EnergyLevel.MEDIUM,
             min_duration=30,
             buffer_required=15,
-            events=[]
+            events=()
         )
     ]
 
-def test_reschedule_maintains_relative_task_order(work_day_zones):
+@pytest.fixture(scope="session")
+def strategy():
+    """SequenceBasedStrategy keeps no state between schedule() calls, so one instance is shared"""
+    return SequenceBasedStrategy()
+
+@pytest.fixture(scope="module")
+def scheduler(work_day_zones, strategy):
+    """Scheduler keeps no plan between reschedule() calls, so one instance is shared"""
+    return Scheduler(
+        task_repo=MockTaskRepository(),
+        calendar_repo=MockCalendarRepository(work_day_zones),
+        strategy=strategy,
+        clock=lambda: _NOW
+    )
+
+@pytest.mark.parametrize("n", [2, 8, 16])
+def test_reschedule_maintains_relative_task_order(scheduler, n):
     """
     When: Multiple tasks are rescheduled
     Then: Their relative order should be maintained
     """
-    # Create mock repositories and strategy
-    task_repo = Mock()
-    calendar_repo = Mock()
-    strategy = SequenceBasedStrategy()
-
-    # Configure mock behavior
-    calendar_repo.get_events.return_value = []
-    calendar_repo.get_zones.return_value = work_day_zones
-    task_repo.get_tasks.return_value = []
-
-    # Create tasks with sequential order
-    task1 = Task(
-        id="task1",
-        title="First Task",
-        duration=60,
-        due_date=datetime.now() + timedelta(days=1),
-        project_id="proj1",
-        sequence_number=1,
-        constraints=TaskConstraints(
-            zone_type=ZoneType.DEEP,
-            energy_level=EnergyLevel.HIGH,
-            is_splittable=False,
-            min_chunk_duration=30,
-            max_split_count=1,
-            required_buffer=15,
-            dependencies=[]
-        )
-    )
-
-    task2 = Task(
-        id="task2",
-        title="Second Task",
-        duration=60,
-        due_date=datetime.now() + timedelta(days=1),
-        project_id="proj1",
-        sequence_number=2,
-        constraints=TaskConstraints(
-            zone_type=ZoneType.DEEP,
-            energy_level=EnergyLevel.HIGH,
-            is_splittable=False,
-            min_chunk_duration=30,
-            max_split_count=1,
-            required_buffer=15,
-            dependencies=["task1"]
-        )
-    )
-
-    # Create scheduler
-    scheduler = Scheduler(
-        task_repo=task_repo,
-        calendar_repo=calendar_repo,
-        strategy=strategy
-    )
-
     # Reschedule tasks
-    schedule = scheduler.reschedule([task1, task2])
+    tasks = _sequential_tasks(n)
+    schedule = scheduler.reschedule(tasks)
+
+    # Get scheduled events in task order
+    by_id = _index_schedule(schedule)
+    events = [by_id[task.id] for task in tasks]
 
-    # Get scheduled events
-    event1 = next(e for e in schedule if e.id == "task1")
-    event2 = next(e for e in schedule if e.id == "task2")
+    # Verify placement is deterministic under the frozen clock
+    assert events[0].start == _NOW.replace(hour=9), "First task should open the first zone"
 
     # Verify order
-    assert event1.start < event2.start, "Task1 should be scheduled before Task2"
+    assert all(current.start < following.start
+               for current, following in zip(events, events[1:])), \
+        "Tasks should be scheduled in sequence order"
     
     # Verify buffer
-    buffer_time = (event2.start - event1.end).total_seconds() / 60
-    assert buffer_time >= 15, "Buffer between tasks should be at least 15 minutes"
+    assert all(following.start - current.end >= _MIN_BUFFER
+               for current, following in zip(events, events[1:])), \
+        f"Buffer between tasks should be at least {_MIN_BUFFER}"
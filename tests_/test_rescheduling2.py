@@ -1,59 +1,124 @@
-
+import logging
 import pytest
+from bisect import bisect_right
+from dataclasses import replace
+from functools import partial
 from datetime import datetime, timedelta
 from typing import List
 from src_.domain.task import Task, TaskConstraints, ZoneType, EnergyLevel
 from src_.domain.scheduler import Scheduler
 from src_.domain.timeblock import TimeBlockZone, Event, TimeBlockType
 from src_.domain.scheduling import SequenceBasedStrategy
-from unittest.mock import Mock
-from src_.domain.scheduling.strategies import SequenceBasedStrategy
-
-@pytest.fixture
-def work_day_zones():
-    start_time = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
+from stubs import MockCalendarRepository, MockTaskRepository
+
+logger = logging.getLogger(__name__)
+
+# Monday 9:00 AM; a fixed instant so every test, and every pytest-xdist worker,
+# schedules against the same working day
+_NOW = datetime(2024, 1, 1, 9, 0)
+
+# Shared, read-only constraints; derive variants with dataclasses.replace()
+_DEEP_HIGH = TaskConstraints(
+    zone_type=ZoneType.DEEP,
+    energy_level=EnergyLevel.HIGH,
+    is_splittable=False,
+    min_chunk_duration=30,
+    max_split_count=1,
+    required_buffer=15,
+    dependencies=()
+)
+
+_LIGHT_MEDIUM = TaskConstraints(
+    zone_type=ZoneType.LIGHT,
+    energy_level=EnergyLevel.MEDIUM,
+    is_splittable=False,
+    min_chunk_duration=30,
+    max_split_count=1,
+    required_buffer=15,
+    dependencies=()
+)
+
+# Derived variants, built once at import
+_DEEP_HIGH_SPLITTABLE = replace(
+    _DEEP_HIGH,
+    is_splittable=True,
+    min_chunk_duration=60,  # 1 hour minimum chunks
+    max_split_count=4
+)
+_LIGHT_MEDIUM_AFTER_TASK1 = replace(_LIGHT_MEDIUM, dependencies=("task1",))
+_LIGHT_MEDIUM_AFTER_WRITE = replace(_LIGHT_MEDIUM, dependencies=("write",))
+
+def _day_zones(start_time: datetime) -> List[TimeBlockZone]:
+    """DEEP (9:00 - 13:00) and LIGHT (13:00 - 17:00) zones for the day of start_time"""
     return [
         TimeBlockZone(
-            zone_type=ZoneType.DEEP,
             start=start_time,
-            end=start_time + timedelta(hours=4),  # 9:00 - 13:00
+            end=start_time + timedelta(hours=4),
+            zone_type=ZoneType.DEEP,
             energy_level=EnergyLevel.HIGH,
             min_duration=30,
             buffer_required=15,
-            events=[]
+            events=()
         ),
         TimeBlockZone(
-            zone_type=ZoneType.LIGHT,
             start=start_time + timedelta(hours=4),
-            end=start_time + timedelta(hours=8),  # 13:00 - 17:00
+            end=start_time + timedelta(hours=8),
+            zone_type=ZoneType.LIGHT,
             energy_level=EnergyLevel.MEDIUM,
             min_duration=30,
             buffer_required=15,
-            events=[]
+            events=()
         )
     ]
 
+def _expand_zones(day_zones: List[TimeBlockZone], days: int = 7) -> List[TimeBlockZone]:
+    """Repeats a day's zones over consecutive days, preserving both zone types"""
+    return [
+        replace(zone,
+                start=zone.start + timedelta(days=day),
+                end=zone.end + timedelta(days=day),
+                events=())
+        for day in range(days)
+        for zone in day_zones
+    ]
+
+class MultiDayStrategy(SequenceBasedStrategy):
+    """
+    SequenceBasedStrategy that schedules into base_zones repeated over the
+    given number of days, ignoring the zones passed in by the Scheduler.
+    """
+
+    def __init__(self, base_zones: List[TimeBlockZone], days: int = 7):
+        self.zones = _expand_zones(base_zones, days)
+
+    def schedule(self, tasks, zones, existing_events):
+        logger.debug("Scheduling %s into %d zones", [t.id for t in tasks], len(self.zones))
+        result = super().schedule(tasks, self.zones, existing_events)
+        for event in result:
+            logger.debug("Event: %s, Time: %s-%s", event.id, event.start, event.end)
+        return result
+
+@pytest.fixture(scope="module")
+def work_day_zones():
+    """The DEEP/LIGHT zones of _NOW's day, shared read-only by the module's tests"""
+    return tuple(_day_zones(_NOW))
+
+@pytest.fixture(scope="module")
+def work_day_zone_starts(work_day_zones):
+    """Start times of work_day_zones, for bisecting to the zone of an event"""
+    return [zone.start for zone in work_day_zones]
+
+@pytest.fixture(scope="session")
+def multi_day_strategy():
+    """A week of DEEP/LIGHT zones starting at _NOW, built once per session"""
+    return MultiDayStrategy(_day_zones(_NOW))
+
 @pytest.fixture
 def mock_task_repo():
-    class MockTaskRepository:
-        def get_tasks(self):
-            return []
-        
-        def mark_scheduled(self, task_id):
-            pass
     return MockTaskRepository()
 
 @pytest.fixture
 def mock_calendar_repo():
-    class MockCalendarRepository:
-        def get_events(self, start, end):
-            return []
-        
-        def create_event(self, event):
-            return "new_event_id"
-        
-        def remove_managed_events(self):
-            pass
     return MockCalendarRepository()
 
 @pytest.fixture
@@ -61,96 +126,40 @@ def scheduler(mock_task_repo, mock_calendar_repo):
     return Scheduler(
         task_repo=mock_task_repo,
         calendar_repo=mock_calendar_repo,
-        strategy=SequenceBasedStrategy()
+        strategy=SequenceBasedStrategy(),
+        clock=lambda: _NOW
     )
 
-def test_reschedule_on_task_duration_change():
+def test_reschedule_on_task_duration_change(multi_day_strategy):
     """
     When: Task duration is updated
     Then: Only affected task and its dependents should be rescheduled
     And: Other tasks should maintain their original schedule
     """
-    print("\n=== Test: Reschedule on Task Duration Change ===")
+    logger.debug("=== Test: Reschedule on Task Duration Change ===")
     
-    start_time = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
+    start_time = _NOW
     
-    # Create both DEEP and LIGHT zones
-    day_zones = [
-        TimeBlockZone(
-            start=start_time,
-            end=start_time + timedelta(hours=4),
-            zone_type=ZoneType.DEEP,
-            energy_level=EnergyLevel.HIGH,
-            min_duration=30,
-            buffer_required=15,
-            events=[]
-        ),
-        TimeBlockZone(
-            start=start_time + timedelta(hours=4),
-            end=start_time + timedelta(hours=8),
-            zone_type=ZoneType.LIGHT,
-            energy_level=EnergyLevel.MEDIUM,
-            min_duration=30,
-            buffer_required=15,
-            events=[]
-        )
-    ]
+    # The day's DEEP and LIGHT zones, as served by the calendar
+    day_zones = _day_zones(start_time)
 
-    print("\n=== Debug Point 1: Initial Zones ===")
+    logger.debug("=== Debug Point 1: Initial Zones ===")
     for zone in day_zones:
-        print(f"Zone: {zone.zone_type}, Time: {zone.start.strftime('%H:%M')}-{zone.end.strftime('%H:%M')}, "
-              f"Energy: {zone.energy_level}")
+        logger.debug("Zone: %s, Time: %s-%s, Energy: %s",
+                     zone.zone_type.name, zone.start, zone.end, zone.energy_level.name)
 
     # Create mock repositories
-    task_repo = Mock()
-    calendar_repo = Mock()
+    task_repo = MockTaskRepository()
     
-    # Configure mock behavior
-    calendar_repo.get_events.return_value = []
-    calendar_repo.get_zones.return_value = day_zones
-    task_repo.get_tasks.return_value = []
-
-    class TestStrategy(SequenceBasedStrategy):
-        def schedule(self, tasks, zones, existing_events):
-            print("\n=== Debug Point 2: Strategy Schedule Called ===")
-            print(f"Tasks to schedule: {[t.id for t in tasks]}")
-            print(f"Initial zones count: {len(zones)}")
-            
-            # Create multi-day zones while preserving both zone types
-            multi_day_zones = []
-            for day in range(7):
-                day_start = start_time + timedelta(days=day)
-                for zone in day_zones:
-                    new_zone = TimeBlockZone(
-                        start=day_start.replace(hour=zone.start.hour, minute=zone.start.minute),
-                        end=day_start.replace(hour=zone.end.hour, minute=zone.end.minute),
-                        zone_type=zone.zone_type,
-                        energy_level=zone.energy_level,
-                        min_duration=zone.min_duration,
-                        buffer_required=zone.buffer_required,
-                        events=[]
-                    )
-                    multi_day_zones.append(new_zone)
-
-            print("\n=== Debug Point 3: Multi-day Zones Created ===")
-            for i, zone in enumerate(multi_day_zones[:4]):  # Print first 4 zones for brevity
-                print(f"Zone {i}: {zone.zone_type}, "
-                      f"Time: {zone.start.strftime('%Y-%m-%d %H:%M')}-{zone.end.strftime('%H:%M')}")
-
-            result = super().schedule(tasks, multi_day_zones, existing_events)
-            
-            print("\n=== Debug Point 4: Schedule Result ===")
-            for event in result:
-                print(f"Event: {event.id}, "
-                      f"Time: {event.start.strftime('%Y-%m-%d %H:%M')}-{event.end.strftime('%H:%M')}")
-            
-            return result
-
-    # Create scheduler with our custom strategy
+    # Calendar serves the test zones
+    calendar_repo = MockCalendarRepository(day_zones)
+
+    # Create scheduler with the week-long DEEP/LIGHT strategy
     scheduler = Scheduler(
         task_repo=task_repo,
         calendar_repo=calendar_repo,
-        strategy=TestStrategy()
+        strategy=multi_day_strategy,
+        clock=lambda: _NOW
     )
 
     # Create initial task and dependent task
@@ -161,15 +170,7 @@ def test_reschedule_on_task_duration_change():
         due_date=start_time + timedelta(days=1),
         project_id="proj1",
         sequence_number=1,
-        constraints=TaskConstraints(
-            zone_type=ZoneType.DEEP,
-            energy_level=EnergyLevel.HIGH,
-            is_splittable=False,
-            min_chunk_duration=30,
-            max_split_count=1,
-            required_buffer=15,
-            dependencies=[]
-        )
+        constraints=_DEEP_HIGH
     )
 
     dependent_task = Task(
@@ -179,32 +180,25 @@ def test_reschedule_on_task_duration_change():
         due_date=start_time + timedelta(days=1),
         project_id="proj1",
         sequence_number=2,
-        constraints=TaskConstraints(
-            zone_type=ZoneType.LIGHT,
-            energy_level=EnergyLevel.MEDIUM,
-            is_splittable=False,
-            min_chunk_duration=30,
-            max_split_count=1,
-            required_buffer=15,
-            dependencies=["task1"]
-        )
+        constraints=_LIGHT_MEDIUM_AFTER_TASK1
     )
 
-    print("\n=== Debug Point 5: Initial Tasks Configuration ===")
-    print(f"Task 1: {task1.id}, Duration: {task1.duration}, Zone: {task1.constraints.zone_type}")
-    print(f"Dependent: {dependent_task.id}, Duration: {dependent_task.duration}, "
-          f"Zone: {dependent_task.constraints.zone_type}")
+    logger.debug("=== Debug Point 5: Initial Tasks Configuration ===")
+    for task in (task1, dependent_task):
+        logger.debug("Task: %s, Duration: %d, Zone: %s",
+                     task.id, task.duration, task.constraints.zone_type.name)
 
     # Initial schedule
-    print("\n=== Debug Point 6: Creating Initial Schedule ===")
+    logger.debug("=== Debug Point 6: Creating Initial Schedule ===")
     initial_schedule = scheduler.reschedule([task1, dependent_task])
     
-    print("\n=== Debug Point 7: Initial Schedule Created ===")
+    logger.debug("=== Debug Point 7: Initial Schedule Created ===")
     for event in initial_schedule:
-        print(f"Event: {event.id}, Time: {event.start.strftime('%H:%M')}-{event.end.strftime('%H:%M')}")
+        logger.debug("Event: %s, Time: %s-%s", event.id, event.start, event.end)
     
     # Record initial timing of dependent task
-    initial_dependent_event = next(e for e in initial_schedule if e.id == "dependent")
+    by_id = {e.id: e for e in initial_schedule}
+    initial_dependent_event = by_id["dependent"]
     initial_dependent_start = initial_dependent_event.start
 
     # Update task1 duration
@@ -218,26 +212,27 @@ def test_reschedule_on_task_duration_change():
         constraints=task1.constraints
     )
 
-    print("\n=== Debug Point 8: Rescheduling with Updated Duration ===")
-    print(f"Updated Task 1 duration: {updated_task1.duration}")
+    logger.debug("=== Debug Point 8: Rescheduling with Updated Duration ===")
+    logger.debug("Updated Task 1 duration: %d", updated_task1.duration)
 
     # Reschedule with updated duration
     updated_schedule = scheduler.reschedule([updated_task1, dependent_task])
 
-    print("\n=== Debug Point 9: Final Schedule ===")
+    logger.debug("=== Debug Point 9: Final Schedule ===")
     for event in updated_schedule:
-        print(f"Event: {event.id}, Time: {event.start.strftime('%H:%M')}-{event.end.strftime('%H:%M')}")
+        logger.debug("Event: %s, Time: %s-%s", event.id, event.start, event.end)
 
     # Verify results
-    updated_task1_event = next(e for e in updated_schedule if e.id == "task1")
-    updated_dependent_event = next(e for e in updated_schedule if e.id == "dependent")
+    by_id = {e.id: e for e in updated_schedule}
+    updated_task1_event = by_id["task1"]
+    updated_dependent_event = by_id["dependent"]
 
     # Verify task1 has new duration
     task1_duration = (updated_task1_event.end - updated_task1_event.start).total_seconds() / 60
-    print(f"\n=== Debug Point 10: Verification ===")
-    print(f"Task1 actual duration: {task1_duration} minutes")
-    print(f"Task1 expected duration: {updated_task1.duration} minutes")
-    print(f"Dependent task moved: {updated_dependent_event.start != initial_dependent_start}")
+    logger.debug("=== Debug Point 10: Verification ===")
+    logger.debug("Task1 actual duration: %s minutes", task1_duration)
+    logger.debug("Task1 expected duration: %d minutes", updated_task1.duration)
+    logger.debug("Dependent task moved: %s", updated_dependent_event.start != initial_dependent_start)
     
     assert task1_duration == 120, f"Expected duration 120, got {task1_duration}"
 
@@ -246,70 +241,19 @@ def test_reschedule_on_task_duration_change():
 
     # Verify proper buffer between tasks
     buffer_time = (updated_dependent_event.start - updated_task1_event.end).total_seconds() / 60
-    print(f"Buffer time between tasks: {buffer_time} minutes")
+    logger.debug("Buffer time between tasks: %s minutes", buffer_time)
     assert buffer_time >= 15, f"Expected buffer >= 15 minutes, got {buffer_time} minutes"
 
-def test_reschedule_preserves_zone_integrity(work_day_zones):
-    """
-    When: Task is rescheduled
-    Then: Zone type constraints must be maintained
-    And: Energy level requirements must be respected
-    """
-    # Create mock repositories and strategy
-    task_repo = Mock()
-    calendar_repo = Mock()
-    strategy = SequenceBasedStrategy()
-
-    # Configure mock behavior
-    calendar_repo.get_events.return_value = []
-    calendar_repo.get_zones.return_value = work_day_zones
-    task_repo.get_tasks.return_value = []
-
-    deep_task = Task(
-        id="deep_work",
-        title="Deep Work Task",
-        duration=60,
-        due_date=datetime.now() + timedelta(days=1),
-        project_id="proj1",
-        sequence_number=1,
-        constraints=TaskConstraints(
-            zone_type=ZoneType.DEEP,
-            energy_level=EnergyLevel.HIGH,
-            is_splittable=False,
-            min_chunk_duration=30,
-            max_split_count=1,
-            required_buffer=15,
-            dependencies=[]
-        )
-    )
-
-    # Create scheduler with all required dependencies
-    scheduler = Scheduler(
-        task_repo=task_repo,
-        calendar_repo=calendar_repo,
-        strategy=strategy
-    )
-
-    new_schedule = scheduler.reschedule([deep_task])
-
-    deep_event = next(e for e in new_schedule if e.id == "deep_work")
-    scheduled_zone = next(z for z in work_day_zones
-                          if z.start <= deep_event.start <= z.end)
-
-    assert scheduled_zone.zone_type == ZoneType.DEEP  # Changed from type to zone_type
-    assert scheduled_zone.energy_level == EnergyLevel.HIGH
-
 def test_reschedule_maintains_project_sequence():
     """
     When: Tasks in project sequence are rescheduled
     Then: Project task sequence should be maintained
     """
     # Create mock repositories
-    task_repo = Mock()
-    calendar_repo = Mock()
+    task_repo = MockTaskRepository()
     strategy = SequenceBasedStrategy()
     
-    morning = datetime.now().replace(hour=9, minute=0)
+    morning = _NOW
     fixed_events = [
         Event(
             id="meeting1",
@@ -341,27 +285,17 @@ def test_reschedule_maintains_project_sequence():
         )
     ]
 
-    # Configure mock behavior
-    calendar_repo.get_events.return_value = []
-    calendar_repo.get_zones.return_value = work_day_zones
-    task_repo.get_tasks.return_value = []
-
-    base_constraints = TaskConstraints(
-        zone_type=ZoneType.DEEP,
-        energy_level=EnergyLevel.HIGH,
-        is_splittable=False,
-        min_chunk_duration=30,
-        max_split_count=1,
-        required_buffer=15,
-        dependencies=[]
-    )
+    # Calendar serves the test zones
+    calendar_repo = MockCalendarRepository(work_day_zones)
+
+    base_constraints = _DEEP_HIGH
 
     tasks = [
         Task(
             id="step1",
             title="Step 1",
             duration=60,
-            due_date=datetime.now() + timedelta(days=1),
+            due_date=_NOW + timedelta(days=1),
             project_id="proj1",
             sequence_number=1,
             constraints=base_constraints
@@ -370,7 +304,7 @@ def test_reschedule_maintains_project_sequence():
             id="step2",
             title="Step 2",
             duration=60,
-            due_date=datetime.now() + timedelta(days=1),
+            due_date=_NOW + timedelta(days=1),
             project_id="proj1",
             sequence_number=2,
             constraints=base_constraints
@@ -379,7 +313,7 @@ def test_reschedule_maintains_project_sequence():
             id="step3",
             title="Step 3",
             duration=60,
-            due_date=datetime.now() + timedelta(days=1),
+            due_date=_NOW + timedelta(days=1),
             project_id="proj1",
             sequence_number=3,
             constraints=base_constraints
@@ -389,7 +323,8 @@ def test_reschedule_maintains_project_sequence():
     scheduler = Scheduler(
         task_repo=task_repo,
         calendar_repo=calendar_repo,
-        strategy=strategy
+        strategy=strategy,
+        clock=lambda: _NOW
     )
 
     # Reschedule ALL tasks, not just the middle one
@@ -407,80 +342,6 @@ def test_reschedule_maintains_project_sequence():
             f"Task {events[i].id} overlaps with {events[i + 1].id}"
         )
 
-def test_reschedule_handles_buffer_requirements(work_day_zones):
-    """
-    When: Tasks are rescheduled
-    Then: Required buffer times must be maintained
-    And: Zone transition buffers must be respected
-    """
-    # Create mock repositories and strategy
-    task_repo = Mock()
-    calendar_repo = Mock()
-    strategy = SequenceBasedStrategy()
-
-    # Configure mock return values
-    calendar_repo.get_events.return_value = []
-    calendar_repo.get_zones.return_value = work_day_zones
-    task_repo.get_tasks.return_value = []
-
-    # Create task constraints
-    task1_constraints = TaskConstraints(
-        zone_type=ZoneType.DEEP,
-        energy_level=EnergyLevel.HIGH,
-        is_splittable=False,
-        min_chunk_duration=30,
-        max_split_count=1,
-        required_buffer=15,
-        dependencies=[]
-    )
-
-    task2_constraints = TaskConstraints(
-        zone_type=ZoneType.DEEP,
-        energy_level=EnergyLevel.HIGH,
-        is_splittable=False,
-        min_chunk_duration=30,
-        max_split_count=1,
-        required_buffer=30,
-        dependencies=[]
-    )
-
-    # Create tasks with all required arguments
-    tasks = [
-        Task(
-            id="task1",
-            title="Task 1",
-            duration=60,
-            due_date=datetime.now() + timedelta(days=1),
-            sequence_number=1,
-            project_id="proj1",
-            constraints=task1_constraints
-        ),
-        Task(
-            id="task2",
-            title="Task 2",
-            duration=60,
-            due_date=datetime.now() + timedelta(days=1),
-            sequence_number=2,
-            project_id="proj1",
-            constraints=task2_constraints
-        )
-    ]
-
-    # Create scheduler with dependencies
-    scheduler = Scheduler(
-        task_repo=task_repo,
-        calendar_repo=calendar_repo,
-        strategy=strategy
-    )
-
-    schedule = scheduler.reschedule(tasks)
-
-    task1_event = next(e for e in schedule if e.id == "task1")
-    task2_event = next(e for e in schedule if e.id == "task2")
-
-    buffer_time = (task2_event.start - task1_event.end).total_seconds() / 60
-    assert buffer_time >= 30  # Larger buffer should be used
-
 def test_reschedule_handles_partial_day_availability():
     """
     When: Calendar has fixed events
@@ -488,11 +349,10 @@ def test_reschedule_handles_partial_day_availability():
     And: No overlap should occur
     """
     # Create mock repositories
-    task_repo = Mock()
-    calendar_repo = Mock()
+    task_repo = MockTaskRepository()
     strategy = SequenceBasedStrategy()
     
-    morning = datetime.now().replace(hour=9, minute=0)
+    morning = _NOW
     fixed_events = [
         Event(
             id="meeting",
@@ -517,39 +377,31 @@ def test_reschedule_handles_partial_day_availability():
         )
     ]
 
-    # Configure mock behavior
-    calendar_repo.get_events.return_value = []
-    calendar_repo.get_zones.return_value = work_day_zones
-    task_repo.get_tasks.return_value = []
+    # Calendar serves the test zones
+    calendar_repo = MockCalendarRepository(work_day_zones)
 
     task = Task(
         id="work",
         title="Work Task",
         duration=120,
-        due_date=datetime.now() + timedelta(days=1),
+        due_date=_NOW + timedelta(days=1),
         project_id="proj1",
         sequence_number=1,
-        constraints=TaskConstraints(
-            zone_type=ZoneType.DEEP,
-            energy_level=EnergyLevel.HIGH,
-            is_splittable=False,
-            min_chunk_duration=30,
-            max_split_count=1,
-            required_buffer=15,
-            dependencies=[]
-        )
+        constraints=_DEEP_HIGH
     )
 
     # Create scheduler with all required dependencies
     scheduler = Scheduler(
         task_repo=task_repo,
         calendar_repo=calendar_repo,
-        strategy=strategy
+        strategy=strategy,
+        clock=lambda: _NOW
     )
 
     schedule = scheduler.reschedule([task], fixed_events=fixed_events)
 
-    work_event = next(e for e in schedule if e.id == "work")
+    by_id = {e.id: e for e in schedule}
+    work_event = by_id["work"]
     # Check overlap with each fixed event
     for fixed_event in fixed_events:
         assert not (work_event.start < fixed_event.end and
@@ -566,22 +418,14 @@ def test_reschedule_splits_tasks_when_necessary(scheduler, work_day_zones):
         id="splittable",
         title="Splittable Task",
         duration=240,  # 4 hours total
-        due_date=datetime.now() + timedelta(days=1),
+        due_date=_NOW + timedelta(days=1),
         project_id="proj1",
         sequence_number=1,
-        constraints=TaskConstraints(
-            zone_type=ZoneType.DEEP,
-            energy_level=EnergyLevel.HIGH,
-            is_splittable=True,
-            min_chunk_duration=60,  # 1 hour minimum chunks
-            max_split_count=4,
-            required_buffer=15,
-            dependencies=[]
-        )
+        constraints=_DEEP_HIGH_SPLITTABLE
     )
 
     # Create fixed events that force splitting
-    morning = datetime.now().replace(hour=9, minute=0)
+    morning = _NOW
     fixed_events = [
         Event(
             id="meeting1",
@@ -613,11 +457,7 @@ def test_reschedule_splits_tasks_when_necessary(scheduler, work_day_zones):
     ]
 
     # Configure scheduler with our test zones
-    class TestStrategy(SequenceBasedStrategy):
-        def schedule(self, tasks, zones, existing_events):
-            return super().schedule(tasks, work_day_zones, existing_events)
-    
-    scheduler.strategy = TestStrategy()
+    scheduler.strategy = MultiDayStrategy(work_day_zones, days=1)
     schedule = scheduler.reschedule([task], fixed_events=fixed_events)
 
     # Verify splitting
@@ -645,132 +485,25 @@ def test_reschedule_splits_tasks_when_necessary(scheduler, work_day_zones):
     )
     assert total_duration == task.duration
 
-def test_reschedule_handles_energy_level_changes(scheduler, work_day_zones):
-    """
-    When: Energy levels change throughout day
-    Then: Tasks should be scheduled in appropriate energy zones
-    """
-    high_energy_task = Task(
-        id="complex",
-        title="Complex Task",
-        duration=60,
-        due_date=datetime.now() + timedelta(days=1),
-        project_id="proj1",
-        sequence_number=1,
-        constraints=TaskConstraints(
-            zone_type=ZoneType.DEEP,  # Match with available zone type
-            energy_level=EnergyLevel.HIGH,
-            is_splittable=False,
-            min_chunk_duration=30,
-            max_split_count=1,
-            required_buffer=15,
-            dependencies=[]
-        )
-    )
-
-    # Create a strategy that uses work_day_zones
-    class TestStrategy(SequenceBasedStrategy):
-        def schedule(self, tasks, zones, existing_events):
-            # Use work_day_zones instead of provided zones
-            multi_day_zones = self._create_multi_day_zones(work_day_zones)
-            return super().schedule(tasks, multi_day_zones, existing_events)
-
-        def _create_multi_day_zones(self, base_zones: List[TimeBlockZone], days: int = 7) -> List[TimeBlockZone]:
-            multi_day_zones = []
-            start_date = base_zones[0].start
-
-            for day in range(days):
-                day_start = start_date + timedelta(days=day)
-                for zone in base_zones:  # This will now include both DEEP and LIGHT zones
-                    new_zone = TimeBlockZone(
-                        zone_type=zone.zone_type,  # Preserve original zone type
-                        start=day_start.replace(hour=zone.start.hour, minute=zone.start.minute),
-                        end=day_start.replace(hour=zone.end.hour, minute=zone.end.minute),
-                        energy_level=zone.energy_level,
-                        min_duration=zone.min_duration,
-                        buffer_required=zone.buffer_required,
-                        events=[]
-                    )
-                    multi_day_zones.append(new_zone)
-            return multi_day_zones
-
-    scheduler.strategy = TestStrategy()
-    schedule = scheduler.reschedule([high_energy_task])
-
-    # Debug output
-    print(f"Schedule length: {len(schedule)}")
-    print(f"Available zones: {len(work_day_zones)}")
-    for zone in work_day_zones:
-        print(f"Zone: {zone.zone_type}, Energy: {zone.energy_level}, "
-              f"Time: {zone.start}-{zone.end}")
-
-    task_event = next(e for e in schedule if e.id == "complex")
-    scheduled_zone = next(z for z in work_day_zones
-                          if z.start <= task_event.start <= z.end)
-
-    assert scheduled_zone.energy_level == EnergyLevel.HIGH
-
-def test_schedule_dependent_tasks_different_zones():
+def test_schedule_dependent_tasks_different_zones(multi_day_strategy):
     # ARRANGE
-    start_time = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
+    start_time = _NOW
     
-    # Create both DEEP and LIGHT zones for a single day
-    day_zones = [
-        TimeBlockZone(
-            start=start_time,
-            end=start_time + timedelta(hours=4),
-            zone_type=ZoneType.DEEP,
-            energy_level=EnergyLevel.HIGH,
-            min_duration=30,
-            buffer_required=15,
-            events=[]
-        ),
-        TimeBlockZone(
-            start=start_time + timedelta(hours=4),
-            end=start_time + timedelta(hours=8),
-            zone_type=ZoneType.LIGHT,
-            energy_level=EnergyLevel.MEDIUM,
-            min_duration=30,
-            buffer_required=15,
-            events=[]
-        )
-    ]
-
-    # Create a strategy that properly handles both zone types
-    class TestStrategy(SequenceBasedStrategy):
-        def schedule(self, tasks, zones, existing_events):
-            # Create multi-day zones while preserving both zone types
-            multi_day_zones = []
-            for day in range(7):
-                day_start = start_time + timedelta(days=day)
-                for zone in day_zones:
-                    new_zone = TimeBlockZone(
-                        start=day_start.replace(hour=zone.start.hour, minute=zone.start.minute),
-                        end=day_start.replace(hour=zone.end.hour, minute=zone.end.minute),
-                        zone_type=zone.zone_type,
-                        energy_level=zone.energy_level,
-                        min_duration=zone.min_duration,
-                        buffer_required=zone.buffer_required,
-                        events=[]
-                    )
-                    multi_day_zones.append(new_zone)
-            return super().schedule(tasks, multi_day_zones, existing_events)
+    # The day's DEEP and LIGHT zones, as served by the calendar
+    day_zones = _day_zones(start_time)
 
     # Create mock repositories
-    task_repo = Mock()
-    calendar_repo = Mock()
+    task_repo = MockTaskRepository()
     
-    # Configure mock behavior
-    calendar_repo.get_events.return_value = []
-    calendar_repo.get_zones.return_value = day_zones
-    task_repo.get_tasks.return_value = []
+    # Calendar serves the test zones
+    calendar_repo = MockCalendarRepository(day_zones)
 
-    # Create scheduler with our custom strategy
-    strategy = TestStrategy()
+    # Create scheduler with the week-long DEEP/LIGHT strategy
     scheduler = Scheduler(
         task_repo=task_repo,
         calendar_repo=calendar_repo,
-        strategy=strategy
+        strategy=multi_day_strategy,
+        clock=lambda: _NOW
     )
 
     # Create dependent tasks
@@ -781,15 +514,7 @@ def test_schedule_dependent_tasks_different_zones():
         due_date=start_time + timedelta(days=1),
         project_id="proj1",
         sequence_number=1,
-        constraints=TaskConstraints(
-            zone_type=ZoneType.DEEP,
-            energy_level=EnergyLevel.HIGH,
-            is_splittable=False,
-            min_chunk_duration=30,
-            max_split_count=1,
-            required_buffer=15,
-            dependencies=[]
-        )
+        constraints=_DEEP_HIGH
     )
 
     task2 = Task(
@@ -799,23 +524,16 @@ def test_schedule_dependent_tasks_different_zones():
         due_date=start_time + timedelta(days=1),
         project_id="proj1",
         sequence_number=2,
-        constraints=TaskConstraints(
-            zone_type=ZoneType.LIGHT,
-            energy_level=EnergyLevel.MEDIUM,
-            is_splittable=False,
-            min_chunk_duration=30,
-            max_split_count=1,
-            required_buffer=15,
-            dependencies=["task1"]
-        )
+        constraints=_LIGHT_MEDIUM_AFTER_TASK1
     )
 
     # ACT
     schedule = scheduler.reschedule([task1, task2])
 
     # ASSERT
-    task1_event = next(e for e in schedule if e.id == "task1")
-    task2_event = next(e for e in schedule if e.id == "task2")
+    by_id = {e.id: e for e in schedule}
+    task1_event = by_id["task1"]
+    task2_event = by_id["task2"]
 
     # Task 1 should be scheduled in DEEP zone
     assert task1_event.start >= start_time
@@ -834,125 +552,85 @@ def test_schedule_dependent_tasks_different_zones():
     buffer_time = (task2_event.start - task1_event.end).total_seconds() / 60
     assert buffer_time >= 15, "Buffer between task1 and task2 should be at least 15 minutes"
 
-def test_write_review_workflow():
-    """Test scheduling a writing task followed by a review task"""
-    # ARRANGE
-    start_time = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
-    
-    # Create both DEEP and LIGHT zones
-    day_zones = [
-        TimeBlockZone(
-            start=start_time,
-            end=start_time + timedelta(hours=4),
-            zone_type=ZoneType.DEEP,
-            energy_level=EnergyLevel.HIGH,
-            min_duration=30,
-            buffer_required=15,
-            events=[]
-        ),
-        TimeBlockZone(
-            start=start_time + timedelta(hours=4),
-            end=start_time + timedelta(hours=8),
-            zone_type=ZoneType.LIGHT,
-            energy_level=EnergyLevel.MEDIUM,
-            min_duration=30,
-            buffer_required=15,
-            events=[]
-        )
-    ]
-
-    # Define TestStrategy class
-    class TestStrategy(SequenceBasedStrategy):
-        def schedule(self, tasks, zones, existing_events):
-            # Create multi-day zones while preserving both zone types
-            multi_day_zones = []
-            for day in range(7):
-                day_start = start_time + timedelta(days=day)
-                for zone in day_zones:
-                    new_zone = TimeBlockZone(
-                        start=day_start.replace(hour=zone.start.hour, minute=zone.start.minute),
-                        end=day_start.replace(hour=zone.end.hour, minute=zone.end.minute),
-                        zone_type=zone.zone_type,
-                        energy_level=zone.energy_level,
-                        min_duration=zone.min_duration,
-                        buffer_required=zone.buffer_required,
-                        events=[]
-                    )
-                    multi_day_zones.append(new_zone)
-            return super().schedule(tasks, multi_day_zones, existing_events)
-
-    # Create mock repositories
-    task_repo = Mock()
-    calendar_repo = Mock()
-    
-    # Configure mock behavior
-    calendar_repo.get_events.return_value = []
-    calendar_repo.get_zones.return_value = day_zones
-    task_repo.get_tasks.return_value = []
-
-    # Create tasks
-    write_task = Task(
-        id="write",
-        title="Write Document",
-        duration=90,
-        due_date=start_time + timedelta(days=1),
+def _task(task_id, constraints=_DEEP_HIGH, duration=60, sequence_number=1):
+    return Task(
+        id=task_id,
+        title=task_id.replace("_", " ").title(),
+        duration=duration,
+        due_date=_NOW + timedelta(days=1),
         project_id="proj1",
-        sequence_number=1,
-        constraints=TaskConstraints(
-            zone_type=ZoneType.DEEP,
-            energy_level=EnergyLevel.HIGH,
-            is_splittable=False,
-            min_chunk_duration=30,
-            max_split_count=1,
-            required_buffer=15,
-            dependencies=[]
-        )
+        sequence_number=sequence_number,
+        constraints=constraints
     )
 
-    review_task = Task(
-        id="review",
-        title="Review Document",
-        duration=30,
-        due_date=start_time + timedelta(days=1),
-        project_id="proj1",
-        sequence_number=2,
-        constraints=TaskConstraints(
-            zone_type=ZoneType.LIGHT,
-            energy_level=EnergyLevel.MEDIUM,
-            is_splittable=False,
-            min_chunk_duration=30,
-            max_split_count=1,
-            required_buffer=15,
-            dependencies=["write"]
-        )
-    )
+def _zone_of(zones_sorted, starts, when):
+    """The zone containing when, given zones sorted by start and their starts"""
+    i = bisect_right(starts, when) - 1
+    return zones_sorted[i] if i >= 0 and zones_sorted[i].end >= when else None
 
-    # Create scheduler with our custom strategy
-    scheduler = Scheduler(
-        task_repo=task_repo,
-        calendar_repo=calendar_repo,
-        strategy=TestStrategy()
-    )
+def _check_zone_integrity(by_id, zone_of):
+    # Zone type and energy level constraints must be maintained
+    scheduled_zone = zone_of(by_id["deep_work"].start)
+    assert scheduled_zone.zone_type == ZoneType.DEEP
+    assert scheduled_zone.energy_level == EnergyLevel.HIGH
 
-    # ACT
-    schedule = scheduler.reschedule([write_task, review_task])
+def _check_buffer(by_id, zone_of):
+    # The larger of the two required buffers must separate the tasks
+    assert by_id["task2"].start - by_id["task1"].end >= timedelta(minutes=30)
 
-    # ASSERT
-    write_event = next(e for e in schedule if e.id == "write")
-    review_event = next(e for e in schedule if e.id == "review")
+def _check_energy(by_id, zone_of):
+    # High energy tasks land in high energy zones
+    assert zone_of(by_id["complex"].start).energy_level == EnergyLevel.HIGH
 
-    # Debug output
-    print("\nScheduled Events:")
-    for event in schedule:
-        print(f"Event: {event.id}, Time: {event.start.strftime('%H:%M')}-{event.end.strftime('%H:%M')}")
+def _check_write_review(by_id, zone_of):
+    write_event = by_id["write"]
+    review_event = by_id["review"]
 
-    # Verify write task is in DEEP zone
+    # Write task is in the morning DEEP zone
     assert write_event.start.hour == 9
     assert (write_event.end - write_event.start).total_seconds() / 60 == 90
 
-    # Verify review task is in LIGHT zone
-    assert review_event.start.hour >= 13  # Should be in afternoon LIGHT zone
+    # Review task is in the afternoon LIGHT zone, after the write task
+    assert review_event.start.hour >= 13
     assert (review_event.end - review_event.start).total_seconds() / 60 == 30
-
-    # Verify sequence
     assert review_event.start > write_event.end
+
+@pytest.mark.parametrize("tasks, week_strategy, check", [
+    pytest.param(
+        [_task("deep_work")],
+        False, _check_zone_integrity, id="preserves_zone_integrity"
+    ),
+    pytest.param(
+        [_task("task1"),
+         _task("task2", replace(_DEEP_HIGH, required_buffer=30), sequence_number=2)],
+        False, _check_buffer, id="handles_buffer_requirements"
+    ),
+    pytest.param(
+        [_task("complex")],
+        True, _check_energy, id="handles_energy_level_changes"
+    ),
+    pytest.param(
+        [_task("write", duration=90),
+         _task("review", _LIGHT_MEDIUM_AFTER_WRITE,
+               duration=30, sequence_number=2)],
+        True, _check_write_review, id="write_review_workflow"
+    ),
+])
+def test_reschedule_scenarios(work_day_zones, work_day_zone_starts, multi_day_strategy,
+                              tasks, week_strategy, check):
+    """
+    When: Tasks are rescheduled into the day's DEEP/LIGHT zones
+          (or a week of them, for week_strategy scenarios)
+    Then: Each scenario's zone, energy, buffer and ordering rules hold
+    """
+    scheduler = Scheduler(
+        task_repo=MockTaskRepository(),
+        calendar_repo=MockCalendarRepository(work_day_zones),
+        strategy=multi_day_strategy if week_strategy else SequenceBasedStrategy(),
+        clock=lambda: _NOW
+    )
+
+    schedule = scheduler.reschedule(tasks)
+
+    check({e.id: e for e in schedule},
+          partial(_zone_of, work_day_zones, work_day_zone_starts))
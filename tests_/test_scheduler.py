@@ -1,30 +1,44 @@
 import pytest
 from datetime import datetime, timedelta
-from src_.domain.scheduler import Scheduler, SchedulingStrategy
-from src_.domain.task import Task
-from src_.domain.timeblock import TimeBlockZone, Event
+from src_.domain.scheduler import Scheduler, SchedulingStrategy, _RESCHEDULE_CACHE_SIZE
+from src_.domain.task import Task, TaskConstraints, ZoneType, EnergyLevel
+from src_.domain.timeblock import Event, TimeBlockType
+from stubs import MockCalendarRepository, MockTaskRepository
 
 class SimpleSchedulingStrategy(SchedulingStrategy):
     def schedule(self, tasks, zones, existing_events):
         # Simple implementation for testing
         return []
 
-class MockTaskRepository:
-    def get_tasks(self):
-        return []
-    
-    def mark_scheduled(self, task_id):
-        pass
+class RecordingStrategy(SchedulingStrategy):
+    def __init__(self, events=()):
+        self.calls = 0
+        self.events = events
+        self.existing = None
 
-class MockCalendarRepository:
-    def get_events(self, start, end):
-        return []
-    
-    def create_event(self, event):
-        return "new_event_id"
-    
-    def remove_managed_events(self):
-        pass
+    def schedule(self, tasks, zones, existing_events):
+        self.calls += 1
+        self.existing = [e.id for e in existing_events]
+        return list(self.events)
+
+def make_task(task_id, dependencies=(), duration=60):
+    return Task(
+        id=task_id,
+        title=task_id,
+        duration=duration,
+        due_date=datetime(2024, 1, 2, 9, 0),
+        project_id="proj1",
+        sequence_number=1,
+        constraints=TaskConstraints(
+            zone_type=ZoneType.DEEP,
+            energy_level=EnergyLevel.HIGH,
+            is_splittable=False,
+            min_chunk_duration=30,
+            max_split_count=1,
+            required_buffer=15,
+            dependencies=dependencies
+        )
+    )
 
 class TestScheduler:
     @pytest.fixture
@@ -37,4 +51,97 @@ class TestScheduler:
 
     def test_basic_scheduling_workflow(self, scheduler):
         # Test the main scheduling workflow
-        scheduler.schedule_tasks(planning_horizon=21)  # 3 weeks
\ No newline at end of file
+        scheduler.schedule_tasks(planning_horizon=21)  # 3 weeks
+
+    def test_reschedule_reuses_result_for_identical_inputs(self):
+        strategy = RecordingStrategy()
+        scheduler = Scheduler(
+            task_repo=MockTaskRepository(),
+            calendar_repo=MockCalendarRepository(),
+            strategy=strategy,
+            clock=lambda: datetime(2024, 1, 1, 8, 0)
+        )
+
+        scheduler.reschedule([make_task("a"), make_task("b", dependencies=("a",))])
+        scheduler.reschedule([make_task("a"), make_task("b", dependencies=("a",))])
+        assert strategy.calls == 1
+
+        scheduler.reschedule([make_task("a", duration=120), make_task("b", dependencies=("a",))])
+        assert strategy.calls == 2
+
+    def test_reschedule_reuses_result_later_the_same_day(self):
+        strategy = RecordingStrategy()
+        times = iter([datetime(2024, 1, 1, 8, 0, 5, 120), datetime(2024, 1, 1, 8, 7, 41, 999)])
+        scheduler = Scheduler(
+            task_repo=MockTaskRepository(),
+            calendar_repo=MockCalendarRepository(),
+            strategy=strategy,
+            clock=lambda: next(times)
+        )
+
+        scheduler.reschedule([make_task("a")])
+        scheduler.reschedule([make_task("a")])
+        assert strategy.calls == 1
+
+    def test_reschedule_cached_events_are_not_shared(self):
+        start = datetime(2024, 1, 1, 9, 0)
+        strategy = RecordingStrategy(events=[
+            Event(id="a", start=start, end=start + timedelta(hours=1),
+                  title="a", type=TimeBlockType.MANAGED)
+        ])
+        scheduler = Scheduler(
+            task_repo=MockTaskRepository(),
+            calendar_repo=MockCalendarRepository(),
+            strategy=strategy,
+            clock=lambda: datetime(2024, 1, 1, 8, 0)
+        )
+
+        scheduler.reschedule([make_task("a")])[0].start += timedelta(hours=2)
+        first_hit = scheduler.reschedule([make_task("a")])
+        first_hit[0].start += timedelta(hours=2)
+
+        assert scheduler.reschedule([make_task("a")])[0].start == start
+
+    def test_reschedule_evicts_least_recently_used_input(self):
+        strategy = RecordingStrategy()
+        scheduler = Scheduler(
+            task_repo=MockTaskRepository(),
+            calendar_repo=MockCalendarRepository(),
+            strategy=strategy,
+            clock=lambda: datetime(2024, 1, 1, 8, 0)
+        )
+        durations = [30 + 15 * i for i in range(_RESCHEDULE_CACHE_SIZE + 1)]
+
+        for duration in durations:
+            scheduler.reschedule([make_task("a", duration=duration)])
+        assert strategy.calls == len(durations)
+
+        # The newest input is still cached; the oldest was evicted
+        scheduler.reschedule([make_task("a", duration=durations[-1])])
+        assert strategy.calls == len(durations)
+        scheduler.reschedule([make_task("a", duration=durations[0])])
+        assert strategy.calls == len(durations) + 1
+
+    def test_reschedule_works_around_fixed_calendar_events_only(self):
+        start = datetime(2024, 1, 1, 9, 0)
+
+        class CalendarWithEvents(MockCalendarRepository):
+            def get_events(self, start_time, end_time):
+                return [
+                    Event(id="standup", start=start, end=start + timedelta(minutes=15),
+                          title="Standup", type=TimeBlockType.FIXED),
+                    Event(id="old", start=start + timedelta(hours=1), end=start + timedelta(hours=2),
+                          title="Old", type=TimeBlockType.MANAGED),
+                ]
+
+        strategy = RecordingStrategy()
+        scheduler = Scheduler(
+            task_repo=MockTaskRepository(),
+            calendar_repo=CalendarWithEvents(),
+            strategy=strategy,
+            clock=lambda: datetime(2024, 1, 1, 8, 0)
+        )
+
+        scheduler.reschedule([make_task("a")])
+
+        assert strategy.existing == ["standup"]
@@ -1,4 +1,6 @@
+from dataclasses import replace
 from datetime import datetime, timedelta
+from operator import attrgetter
 import pytest
 from src_.domain.splitting import SplitStrategy, SplitMetrics, ChunkPlacement
 from src_.domain.task import Task, TaskConstraints, ZoneType, EnergyLevel
@@ -8,38 +10,36 @@ from src_.domain.timeblock import TimeBlockZone, Event, TimeBlockType
 def strategy():
     return SplitStrategy()
 
-@pytest.fixture
+# (start hour, end hour, zone type, energy level) of each zone in a work day
+WORK_DAY_PATTERN = (
+    (9, 12, ZoneType.DEEP, EnergyLevel.HIGH),      # Morning DEEP work zone
+    (13, 17, ZoneType.LIGHT, EnergyLevel.MEDIUM),  # Afternoon LIGHT work zone
+)
+
+@pytest.fixture(scope="module")
 def work_week_zones():
-    """Creates a week of work zones with realistic patterns"""
-    zones = []
+    """
+    Creates a week of work zones with realistic patterns.
+
+    Shared by the module's tests, so the zones are returned as a tuple and
+    tests that add events must work on copies.
+    """
     start_date = datetime(2024, 1, 1)  # Monday
-    
-    for day in range(5):  # Monday to Friday
-        day_start = start_date + timedelta(days=day)
-        
-        # Morning DEEP work zone (9 AM - 12 PM)
-        zones.append(TimeBlockZone(
-            start=day_start.replace(hour=9),
-            end=day_start.replace(hour=12),
-            zone_type=ZoneType.DEEP,
-            energy_level=EnergyLevel.HIGH,
-            min_duration=30,
-            buffer_required=15,
-            events=[]
-        ))
-        
-        # Afternoon LIGHT work zone (1 PM - 5 PM)
-        zones.append(TimeBlockZone(
-            start=day_start.replace(hour=13),
-            end=day_start.replace(hour=17),
-            zone_type=ZoneType.LIGHT,
-            energy_level=EnergyLevel.MEDIUM,
+
+    # Monday to Friday, one pass over (day, pattern) pairs
+    return tuple(
+        TimeBlockZone(
+            start=start_date + timedelta(days=day, hours=start_hour),
+            end=start_date + timedelta(days=day, hours=end_hour),
+            zone_type=zone_type,
+            energy_level=energy_level,
             min_duration=30,
             buffer_required=15,
-            events=[]
-        ))
-    
-    return zones
+            events=()
+        )
+        for day in range(5)
+        for start_hour, end_hour, zone_type, energy_level in WORK_DAY_PATTERN
+    )
 
 def test_optimal_split_calculation(strategy, work_week_zones):
     """
@@ -126,16 +126,17 @@ def test_split_with_existing_events(strategy, work_week_zones):
     - Should maintain minimum chunk duration
     - Should optimize for fewer splits when possible
     """
-    # Given
+    # Given: a copy of the first zone, so the shared zones stay event-free
+    zones = [replace(work_week_zones[0]), *work_week_zones[1:]]
     existing_event = Event(
         id="existing1",
-        start=work_week_zones[0].start + timedelta(minutes=60),
-        end=work_week_zones[0].start + timedelta(minutes=120),
+        start=zones[0].start + timedelta(minutes=60),
+        end=zones[0].start + timedelta(minutes=120),
         title="Existing Meeting",
         type=TimeBlockType.FIXED,
         buffer_required=15
     )
-    work_week_zones[0].events.append(existing_event)
+    zones[0].add_event(existing_event)
     
     total_duration = 240  # 4 hours
     min_chunk_duration = 60  # 1 hour minimum
@@ -144,7 +145,7 @@ def test_split_with_existing_events(strategy, work_week_zones):
     # When
     metrics = strategy.calculate_optimal_split(
         total_duration=total_duration,
-        available_zones=work_week_zones,
+        available_zones=zones,
         min_chunk_duration=min_chunk_duration,
         max_splits=max_splits
     )
@@ -184,7 +185,7 @@ def test_energy_level_optimization(strategy, work_week_zones):
             min_chunk_duration=60,
             max_split_count=4,
             required_buffer=15,
-            dependencies=[]
+            dependencies=()
         )
     )
     
@@ -199,5 +200,32 @@ def test_energy_level_optimization(strategy, work_week_zones):
     assert len(high_energy_placements) >= 3  # Should find at least 3 good slots
     
     # Verify energy optimization
-    total_energy_cost = sum(p.energy_cost for p in high_energy_placements[:3])
-    assert total_energy_cost <= 2.1  # Average 0.7 per chunk
\ No newline at end of file
+    total_energy_cost = sum(map(attrgetter("energy_cost"), high_energy_placements[:3]))
+    assert total_energy_cost <= 2.1  # Average 0.7 per chunk
+
+def test_zone_pattern_analysis_returns_independent_placements(strategy, work_week_zones):
+    """Repeated analysis of the same zones returns equal, independent placements"""
+    first = strategy.analyze_zone_patterns(zones=work_week_zones, days_ahead=5)
+    original_cost = first[0].energy_cost
+    first[0].energy_cost = 0.0
+
+    second = strategy.analyze_zone_patterns(zones=work_week_zones, days_ahead=5)
+
+    assert second[0].energy_cost == original_cost
+    assert [p.zone_id for p in second] == [p.zone_id for p in first]
+
+def test_short_task_is_not_split(strategy, work_week_zones):
+    """A task no longer than one preferred chunk stays a single chunk"""
+    metrics = strategy.calculate_optimal_split(
+        total_duration=90,
+        available_zones=work_week_zones,
+        min_chunk_duration=30,
+        max_splits=4
+    )
+
+    assert metrics == SplitMetrics(
+        optimal_chunk_count=1,
+        chunk_duration=90,
+        total_buffer_time=30,
+        zone_utilization=1.0
+    )
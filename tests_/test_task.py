@@ -1,8 +1,15 @@
+import re
 import pytest
 import dataclasses
 from datetime import datetime, timedelta
 from src_.domain.task import Task, TaskConstraints, EnergyLevel, ZoneType
 
+# Split error patterns, compiled once for the pytest.raises(match=...) checks
+RE_SPLIT_COUNT = re.compile("Exceeds maximum split count")
+RE_MIN_CHUNK = re.compile("All chunks must be at least")
+RE_SUM = re.compile("Sum of chunk sizes")
+RE_NOT_SPLITTABLE = re.compile("Task is not splittable")
+
 class TestTaskValidation:
     @pytest.fixture
     def valid_constraints(self):
@@ -13,7 +20,7 @@ class TestTaskValidation:
             min_chunk_duration=30,
             max_split_count=2,
             required_buffer=15,
-            dependencies=[]
+            dependencies=()
         )
 
     @pytest.fixture
@@ -29,8 +36,18 @@ class TestTaskValidation:
         )
 
     def test_valid_task_passes_validation(self, valid_task):
+        assert valid_task.is_valid()
         assert valid_task.validate() == []
 
+    def test_is_valid_rejects_invalid_task(self, valid_task):
+        valid_task.duration = -30
+        assert not valid_task.is_valid()
+
+    def test_task_has_no_instance_dict(self, valid_task):
+        assert not hasattr(valid_task, "__dict__")
+        assert not hasattr(valid_task.constraints, "__dict__")
+        assert dataclasses.replace(valid_task, duration=60).duration == 60
+
     def test_rejects_negative_duration(self, valid_task):
         valid_task.duration = -30
         errors = valid_task.validate()
@@ -65,7 +82,7 @@ class TestTaskSplitting:
                 min_chunk_duration=60,  # 1 hour minimum
                 max_split_count=4,
                 required_buffer=15,
-                dependencies=[]
+                dependencies=()
             )
         )
 
@@ -100,28 +117,28 @@ class TestTaskSplitting:
         """Test that split chunks have correct dependency chain"""
         chunks = splittable_task.split(chunk_sizes=[80, 80, 80])
         assert not chunks[0].constraints.dependencies
-        assert chunks[1].constraints.dependencies == [f"{splittable_task.id}_chunk_1"]
-        assert chunks[2].constraints.dependencies == [f"{splittable_task.id}_chunk_2"]
+        assert chunks[1].constraints.dependencies == (f"{splittable_task.id}_chunk_1",)
+        assert chunks[2].constraints.dependencies == (f"{splittable_task.id}_chunk_2",)
 
     def test_split_validates_chunk_count(self, splittable_task):
         """Test validation of maximum split count"""
-        with pytest.raises(ValueError, match="Exceeds maximum split count"):
+        with pytest.raises(ValueError, match=RE_SPLIT_COUNT):
             splittable_task.split(chunk_sizes=[60, 60, 60, 60, 60])
 
     def test_split_validates_minimum_duration(self, splittable_task):
         """Test validation of minimum chunk duration"""
-        with pytest.raises(ValueError, match="All chunks must be at least"):
+        with pytest.raises(ValueError, match=RE_MIN_CHUNK):
             splittable_task.split(chunk_sizes=[45, 45, 150])  # 45 < min_chunk_duration
 
     def test_split_validates_total_duration(self, splittable_task):
         """Test validation of total duration"""
-        with pytest.raises(ValueError, match="Sum of chunk sizes"):
+        with pytest.raises(ValueError, match=RE_SUM):
             splittable_task.split(chunk_sizes=[100, 100, 100])  # Sum > original duration
 
     def test_split_non_splittable_task(self, splittable_task):
         """Test that non-splittable tasks cannot be split"""
         splittable_task.constraints.is_splittable = False
-        with pytest.raises(ValueError, match="Task is not splittable"):
+        with pytest.raises(ValueError, match=RE_NOT_SPLITTABLE):
             splittable_task.split(chunk_sizes=[120, 120])
 
     def test_split_chunks_inherit_buffer(self, splittable_task):
@@ -146,7 +163,7 @@ class TestTaskSplitting:
                 min_chunk_duration=60,
                 max_split_count=3,
                 required_buffer=15,
-                dependencies=["prerequisite_task"]
+                dependencies=("prerequisite_task",)
             )
         )
         
@@ -154,8 +171,8 @@ class TestTaskSplitting:
         # First chunk should inherit original dependencies
         assert "prerequisite_task" in chunks[0].constraints.dependencies
         # Subsequent chunks should depend on previous chunk
-        assert chunks[1].constraints.dependencies == [f"{task.id}_chunk_1"]
-        assert chunks[2].constraints.dependencies == [f"{task.id}_chunk_2"]
+        assert chunks[1].constraints.dependencies == (f"{task.id}_chunk_1",)
+        assert chunks[2].constraints.dependencies == (f"{task.id}_chunk_2",)
 
     def test_split_validates_zone_minimum_duration(self):
         """Test splitting respects zone minimum duration"""
@@ -173,9 +190,9 @@ class TestTaskSplitting:
                 min_chunk_duration=120,  # Deep work minimum
                 max_split_count=2,
                 required_buffer=15,
-                dependencies=[]
+                dependencies=()
             )
         )
         
-        with pytest.raises(ValueError, match="All chunks must be at least"):
+        with pytest.raises(ValueError, match=RE_MIN_CHUNK):
             task.split(chunk_sizes=[90, 90])  # Below deep work minimum
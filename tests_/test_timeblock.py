@@ -1,3 +1,4 @@
+import dataclasses
 import pytest
 from datetime import datetime, timedelta
 from src_.domain.timeblock import TimeBlock, TimeBlockZone, TimeBlockType, Event
@@ -26,7 +27,7 @@ class TestTimeBlockAvailability:
             title="Existing Meeting",
             type=TimeBlockType.FIXED
         )
-        time_block.events.append(event)
+        time_block.add_event(event)
         
         start = time_block.start + timedelta(minutes=45)
         conflicts = time_block.get_conflicts(start, 30)
@@ -45,7 +46,7 @@ class TestTimeBlockZone:
             energy_level=EnergyLevel.HIGH,
             min_duration=120,
             buffer_required=15,
-            events=[]
+            events=()
         )
 
     def test_enforces_minimum_duration(self, deep_work_zone):
@@ -60,9 +61,25 @@ class TestTimeBlockZone:
             title="Existing Task",
             type=TimeBlockType.MANAGED
         )
-        deep_work_zone.events.append(event)
+        deep_work_zone.add_event(event)
         
         # Try to schedule right after the event
         start = event.end
         conflicts = deep_work_zone.get_conflicts(start, 60)
         assert len(conflicts) == 1  # Should conflict due to buffer requirement
+
+    def test_duration_minutes_follows_start_and_end(self, deep_work_zone):
+        assert deep_work_zone.duration_minutes == 240
+        shorter = dataclasses.replace(deep_work_zone, end=deep_work_zone.start + timedelta(hours=1))
+        assert shorter.duration_minutes == 60
+
+        event = Event(
+            id="evt1",
+            start=deep_work_zone.start,
+            end=deep_work_zone.start + timedelta(minutes=45),
+            title="Existing Meeting",
+            type=TimeBlockType.FIXED
+        )
+        assert event.duration_minutes == 45
+        event.end = event.start + timedelta(minutes=90)
+        assert event.duration_minutes == 90
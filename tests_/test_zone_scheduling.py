@@ -1,35 +1,17 @@
 import pytest
+import random
 from datetime import datetime, timedelta
 from src_.domain.task import Task, TaskConstraints, ZoneType, EnergyLevel
 from src_.domain.scheduler import Scheduler
-from src_.domain.timeblock import TimeBlockZone, Event, TimeBlockType
+from src_.domain.timeblock import Event, TimeBlockType
 from src_.domain.scheduling.strategies import SequenceBasedStrategy
 
-def test_schedule_dependent_tasks_different_zones():
+def test_schedule_dependent_tasks_different_zones(fixed_start, deep_zone, light_zone):
     # ARRANGE
-    start_time = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
+    start_time = fixed_start
     
-    # Create both DEEP and LIGHT zones
-    zones = [
-        TimeBlockZone(
-            start=start_time,
-            end=start_time + timedelta(hours=4),
-            zone_type=ZoneType.DEEP,
-            energy_level=EnergyLevel.HIGH,
-            min_duration=30,
-            buffer_required=15,
-            events=[]
-        ),
-        TimeBlockZone(
-            start=start_time + timedelta(hours=4),
-            end=start_time + timedelta(hours=8),
-            zone_type=ZoneType.LIGHT,
-            energy_level=EnergyLevel.MEDIUM,
-            min_duration=30,
-            buffer_required=15,
-            events=[]
-        )
-    ]
+    # Both DEEP and LIGHT zones
+    zones = [deep_zone, light_zone]
     
     write_task = Task(
         id="write",
@@ -45,7 +27,7 @@ def test_schedule_dependent_tasks_different_zones():
             min_chunk_duration=30,
             max_split_count=1,
             required_buffer=15,
-            dependencies=[]
+            dependencies=()
         )
     )
     
@@ -63,7 +45,7 @@ def test_schedule_dependent_tasks_different_zones():
             min_chunk_duration=30,
             max_split_count=1,
             required_buffer=15,
-            dependencies=["write"]
+            dependencies=("write",)
         )
     )
     
@@ -75,8 +57,9 @@ def test_schedule_dependent_tasks_different_zones():
     # ASSERT
     assert len(scheduled_events) == 2, "Both tasks should be scheduled"
     
-    write_event = next(e for e in scheduled_events if e.id == "write")
-    review_event = next(e for e in scheduled_events if e.id == "review")
+    by_id = {e.id: e for e in scheduled_events}
+    write_event = by_id["write"]
+    review_event = by_id["review"]
     
     # Verify correct zone assignment
     assert write_event.start.hour == 9, "Write task should start in DEEP zone"
@@ -87,4 +70,74 @@ def test_schedule_dependent_tasks_different_zones():
     
     # Verify buffer time
     buffer_time = (review_event.start - write_event.end).total_seconds() / 60
-    assert buffer_time >= 15, "Should maintain minimum buffer time"
\ No newline at end of file
+    assert buffer_time >= 15, "Should maintain minimum buffer time"
+
+def _random_task_chain(rng, start_time, size):
+    """Builds a chain of non-splittable DEEP/LIGHT tasks, each optionally
+    depending on an earlier one"""
+    tasks = []
+    for i in range(size):
+        zone_type = rng.choice([ZoneType.DEEP, ZoneType.LIGHT])
+        dependencies = ()
+        if tasks and rng.random() < 0.5:
+            dependencies = (rng.choice(tasks).id,)
+        tasks.append(Task(
+            id=f"task{i}",
+            title=f"Task {i}",
+            duration=rng.choice([30, 60, 90, 120]),
+            due_date=start_time + timedelta(days=7),
+            project_id="proj1",
+            sequence_number=i,
+            constraints=TaskConstraints(
+                zone_type=zone_type,
+                energy_level=(EnergyLevel.HIGH if zone_type == ZoneType.DEEP
+                              else EnergyLevel.MEDIUM),
+                is_splittable=False,
+                min_chunk_duration=30,
+                max_split_count=1,
+                required_buffer=rng.choice([0, 15, 30]),
+                dependencies=dependencies
+            )
+        ))
+    rng.shuffle(tasks)
+    return tasks
+
+def test_schedule_random_task_batches_respect_zones_and_dependencies(
+        fixed_start, deep_zone, light_zone):
+    """
+    Schedules many seeded random task batches with one strategy and one set
+    of zones, checking invariants that must hold for every batch:
+    - Every task is scheduled
+    - Each event lies inside a zone of the task's zone type (same time of day)
+    - Dependent tasks start after their dependencies end
+    - Scheduled events never overlap
+    """
+    rng = random.Random(20240101)
+    strategy = SequenceBasedStrategy()
+    zones = [deep_zone, light_zone]
+    zone_hours = {
+        ZoneType.DEEP: (deep_zone.start.time(), deep_zone.end.time()),
+        ZoneType.LIGHT: (light_zone.start.time(), light_zone.end.time()),
+    }
+
+    for _ in range(50):
+        tasks = _random_task_chain(rng, fixed_start, rng.randint(1, 8))
+        tasks_by_id = {t.id: t for t in tasks}
+
+        events = strategy.schedule(tasks, zones, [])
+        events_by_id = {e.id: e for e in events}
+        assert len(events) == len(tasks), "Every batch fits in the 7-day horizon"
+
+        for event in events:
+            task = tasks_by_id[event.id]
+            zone_start, zone_end = zone_hours[task.constraints.zone_type]
+            assert event.start.date() == event.end.date()
+            assert zone_start <= event.start.time()
+            assert event.end.time() <= zone_end
+            for dep in task.constraints.dependencies:
+                assert dep in events_by_id, "Dependencies are scheduled first"
+                assert events_by_id[dep].end <= event.start
+
+        ordered = sorted(events, key=lambda e: e.start)
+        for current_event, next_event in zip(ordered, ordered[1:]):
+            assert current_event.end <= next_event.start